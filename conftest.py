@@ -11,25 +11,56 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday September 13th 2022 08:33:33 pm                                             #
-# Modified   : Wednesday November 2nd 2022 10:36:33 pm                                             #
+# Modified   : Friday October 16th 2026 11:00:58 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
+import os
 import pytest
-from csf.base.entity import Table
-import pandas as pd
+import numpy as np
+import pydicom
+from pydicom.dataset import FileDataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
 
 # ------------------------------------------------------------------------------------------------ #
+STUDY_ID = "1.2.826.0.1.3680043.12281"
+N_SLICES = 6
+IMAGE_SIZE = 16
+# ------------------------------------------------------------------------------------------------ #
 
 
-@pytest.fixture
-def tables():
-    data = pd.read_csv("tests/data/io/test1.csv", index_col=False)
-    tables = []
-    for i in range(5):
-        name = "test_table_number_" + str(i)
-        desc = "Table for Testing the Registries and Repositories #" + str(i)
+def write_dicom(filepath: str, instance_number: int, pixels: np.ndarray) -> None:
+    """Writes a minimal CT slice positioned 1.25mm apart along the patient z-axis."""
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = pydicom.uid.CTImageStorage
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds = FileDataset(filepath, {}, file_meta=meta, preamble=b"\0" * 128)
+    ds.StudyInstanceUID = STUDY_ID
+    ds.InstanceNumber = instance_number
+    ds.ImagePositionPatient = [0.0, 0.0, -1.25 * instance_number]
+    ds.PixelSpacing = [0.5, 0.5]
+    ds.SliceThickness = 1.0
+    ds.RescaleSlope = 1
+    ds.RescaleIntercept = -1024
+    ds.Rows, ds.Columns = pixels.shape
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 1
+    ds.PixelData = pixels.astype(np.int16).tobytes()
+    ds.save_as(filepath, enforce_file_format=True)
 
-        tables.append(Table(name=name, data=data, type="dataset", description=desc))
-    return tables
+
+@pytest.fixture
+def study_directory(tmp_path):
+    """Directory containing one study whose filenames do not follow the InstanceNumber order."""
+    directory = tmp_path / "train_images"
+    os.makedirs(directory / STUDY_ID)
+    for i, instance_number in enumerate(np.random.default_rng(0).permutation(N_SLICES) + 1):
+        pixels = np.full((IMAGE_SIZE, IMAGE_SIZE), 1024 + instance_number, dtype=np.int16)
+        write_dicom(str(directory / STUDY_ID / "{}.dcm".format(i)), int(instance_number), pixels)
+    return str(directory)
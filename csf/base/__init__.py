@@ -11,14 +11,29 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday November 1st 2022 11:24:14 pm                                               #
-# Modified   : Wednesday November 2nd 2022 05:18:31 am                                             #
+# Modified   : Friday October 16th 2026 11:03:25 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Constants used throughout the package."""
 
-file_formats = ["csv", "yml", "yaml", "pickle", "pkl", "nii", "nib", "dcm", "h5"]
+file_formats = [
+    "csv",
+    "parquet",
+    "yaml",
+    "yml",
+    "pkl",
+    "pickle",
+    "nii",
+    "nib",
+    "dcm",
+    "h5",
+    "vol",
+    "volume",
+    "mask",
+    "rle",
+]
 # ------------------------------------------------------------------------------------------------ #
 
 IMMUTABLE_TYPES: tuple = (str, int, float, bool, type(None))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /cache.py                                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:24:50 pm                                                #
+# Modified   : Friday October 16th 2026 11:12:18 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""In-process LRU cache for IO reads."""
+import os
+import sys
+import copy
+import dataclasses
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from typing import Any, Hashable
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ReadCache:
+    """Least recently used cache bounded by the total size of its values in bytes.
+
+    Keys combine the IO class, the absolute filepath, the file's modification time and size, and
+    the read keyword arguments, so a file that changes on disk is never served stale. Mutable
+    values are copied when cached and on every hit, so callers may modify what they read, as they
+    could without the cache, and never change the cached value. This covers numpy arrays, the
+    pixels of decoded DICOM images, DataFrames, Series, dicts and lists. Cached arrays are also
+    made read-only. A hit on an array therefore costs one memory copy, which is still far cheaper
+    than reading and decoding the file again.
+
+    Args:
+        max_bytes (int): The byte budget. Least recently used values are evicted beyond this.
+    """
+
+    def __init__(self, max_bytes: int = 2 * 1024**3) -> None:
+        self._max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> dict:
+        """Returns the cache counters and current size as a dictionary."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "items": len(self._items),
+            "nbytes": self._nbytes,
+            "max_bytes": self._max_bytes,
+        }
+
+    @staticmethod
+    def make_key(io: type, filepath: str, kwargs: dict) -> Hashable:
+        stat = os.stat(filepath)
+        params = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+        return (io.__name__, os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size, params)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self._hits += 1
+                return self._copy(self._items[key][0])
+            self._misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Adds a value, evicting least recently used values to stay within the byte budget.
+
+        Values larger than the budget are not cached.
+        """
+        nbytes = self.sizeof(value)
+        if nbytes > self._max_bytes:
+            return
+        value = self._copy(value)
+        array = value if isinstance(value, np.ndarray) else getattr(value, "pixels", None)
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+        with self._lock:
+            if key in self._items:
+                self._nbytes -= self._items.pop(key)[1]
+            self._items[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self._max_bytes:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self._nbytes -= evicted
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """Returns a writable copy of arrays and mutable containers, and other values as is."""
+        if isinstance(value, np.ndarray):
+            return np.array(value)
+        elif dataclasses.is_dataclass(value) and isinstance(
+            getattr(value, "pixels", None), np.ndarray
+        ):
+            return dataclasses.replace(value, pixels=np.array(value.pixels))
+        elif isinstance(value, (pd.DataFrame, pd.Series)):
+            return value.copy()
+        elif isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    @classmethod
+    def sizeof(cls, value: Any) -> int:
+        """Returns the approximate size of a value in bytes."""
+        if isinstance(value, np.ndarray):
+            return int(value.nbytes)
+        elif isinstance(value, (pd.DataFrame, pd.Series)):
+            return int(np.sum(value.memory_usage(index=True, deep=True)))
+        elif hasattr(value, "pixels"):
+            return cls.sizeof(value.pixels)
+        elif isinstance(value, (bytes, bytearray)):
+            return len(value)
+        elif hasattr(value, "numpy"):
+            return cls.sizeof(value.numpy())
+        return sys.getsizeof(value)
@@ -11,42 +11,142 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday October 29th 2022 12:46:06 am                                              #
-# Modified   : Tuesday November 1st 2022 11:35:31 pm                                               #
+# Modified   : Friday October 16th 2026 11:13:42 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """IO Module"""
 import os
+import json
+import uuid
+import logging
 from abc import abstractmethod
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pickle
 import tensorflow as tf
 import nibabel as nib
+import h5py
+import pydicom
+from pydicom.multival import MultiValue
+from pydicom.valuerep import DSdecimal, DSfloat, IS
 import yaml
-from typing import Any, Union, List
+from dataclasses import dataclass
+from typing import Any, Union, List, Iterator
 from csf.base.service import Service
+from csf.base.cache import ReadCache
+from csf.base.writer import WriteBehind
+from csf.base.mask import RLEMask, decode_runs
+from concurrent.futures import Future
 
 # ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
 
 
 class IO(Service):
+    """Base class for file IO.
+
+    Reads may be served from an in-process ReadCache shared by all IO classes. The cache is off
+    by default and is turned on with ``IO.enable_cache``.
+
+    Writes are atomic: data are written to a temporary file in the target directory which is then
+    renamed over the target, so a crash never leaves a partially written file. With
+    ``background=True``, the write is queued on a shared WriteBehind writer and a Future is
+    returned; ``IO.flush`` waits for queued writes and raises any write errors.
+    """
+
+    _cache: ReadCache = None
+    _writer: WriteBehind = None
+
     @classmethod
     def read(cls, filepath: str, **kwargs) -> Any:
-        if os.path.exists(filepath):
-            return cls._read(filepath, **kwargs)
-        else:
+        if not os.path.exists(filepath):
             raise FileNotFoundError("File {} not found.".format(filepath))
 
+        if IO._cache is None:
+            return cls._read(filepath, **kwargs)
+
+        key = ReadCache.make_key(cls, filepath, kwargs)
+        data = IO._cache.get(key)
+        if data is None:
+            data = cls._read(filepath, **kwargs)
+            IO._cache.put(key, data)
+        return data
+
+    @classmethod
+    def enable_cache(cls, max_bytes: int = 2 * 1024**3) -> ReadCache:
+        """Turns on the read cache for all IO classes with the given byte budget."""
+        IO._cache = ReadCache(max_bytes=max_bytes)
+        return IO._cache
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        IO._cache = None
+
+    @classmethod
+    def cache_stats(cls) -> Union[dict, None]:
+        """Returns the read cache counters, or None if the cache is off."""
+        return IO._cache.stats() if IO._cache is not None else None
+
     @classmethod
     @abstractmethod
     def _read(cls, filepath: str, **kwargs) -> Any:
         pass
 
     @classmethod
-    def write(cls, filepath: str, data: Any, **kwargs) -> None:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        cls._write(filepath, data, **kwargs)
+    def write(
+        cls, filepath: str, data: Any, background: bool = False, **kwargs
+    ) -> Union[None, Future]:
+        if background:
+            if IO._writer is None:
+                IO.enable_write_behind()
+            return IO._writer.submit(cls._write_atomic, filepath, data, **kwargs)
+        cls._write_atomic(filepath, data, **kwargs)
+
+    @classmethod
+    def enable_write_behind(cls, n_workers: int = 2, max_pending: int = 16) -> WriteBehind:
+        """Configures the shared background writer used by ``write(..., background=True)``."""
+        cls.disable_write_behind()
+        IO._writer = WriteBehind(n_workers=n_workers, max_pending=max_pending)
+        return IO._writer
+
+    @classmethod
+    def disable_write_behind(cls) -> None:
+        """Waits for background writes to complete and shuts down the background writer."""
+        if IO._writer is not None:
+            writer, IO._writer = IO._writer, None
+            writer.shutdown()
+
+    @classmethod
+    def flush(cls) -> None:
+        """Waits for background writes to complete and raises the first write error, if any."""
+        if IO._writer is not None:
+            IO._writer.flush()
+
+    @classmethod
+    def _write_atomic(cls, filepath: str, data: Any, **kwargs) -> None:
+        temp_filepath = cls._temp_filepath(filepath)
+        try:
+            cls._write(temp_filepath, data, **kwargs)
+            if os.path.exists(temp_filepath):
+                os.replace(temp_filepath, filepath)
+        finally:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+
+    @classmethod
+    def _temp_filepath(cls, filepath: str) -> str:
+        """Returns a unique temporary filepath in the directory of filepath, creating it if needed."""
+        directory = os.path.dirname(filepath)
+        os.makedirs(directory or ".", exist_ok=True)
+        name, ext = os.path.splitext(os.path.basename(filepath))
+        return os.path.join(directory, ".{}.{}.tmp{}".format(name, uuid.uuid4().hex, ext))
 
     @classmethod
     @abstractmethod
@@ -60,6 +160,24 @@ class IO(Service):
 
 
 class CSVIO(IO):
+    """Reads and writes CSV files.
+
+    When ``cache`` is True, the parsed table is stored with compact dtypes in a Parquet sidecar
+    alongside the source file, i.e. 'train.csv.parquet'. Identifier and other low cardinality
+    string columns become categorical, integer columns such as the C1-C7 flags are downcast to the
+    smallest integer type, and float columns to float32. The source file's size and modification
+    time are recorded in the sidecar, and later reads are served from the sidecar until either
+    changes. Caching applies only to files with a header row. Sidecars are written atomically, and
+    a sidecar that cannot be read is treated as stale and rebuilt.
+
+    The ``iterate`` method yields the table in chunks of at most ``chunksize`` rows, reading from
+    a fresh sidecar if one exists, so that large tables can be processed in bounded memory.
+    """
+
+    __categorical_columns = ["StudyInstanceUID"]
+    __categorical_ratio = 0.5
+    __cache_key = b"csf_source"
+
     @classmethod
     def _read(
         cls,
@@ -68,10 +186,148 @@ class CSVIO(IO):
         index_col: Union[int, str] = None,
         usecols: List[str] = None,
         low_memory: bool = False,
+        cache: bool = False,
     ) -> pd.DataFrame:
-        return pd.read_csv(
-            filepath, header=header, index_col=index_col, usecols=usecols, low_memory=low_memory
-        )
+        if not cache or header != 0:
+            return pd.read_csv(
+                filepath, header=header, index_col=index_col, usecols=usecols, low_memory=low_memory
+            )
+
+        data = cls._read_cache(filepath, usecols=usecols)
+        if data is None:
+            data = cls._compact(pd.read_csv(filepath, low_memory=low_memory))
+            cls._write_cache(filepath, data)
+            if usecols is not None:
+                data = data[usecols]
+
+        if index_col is not None:
+            data = data.set_index(
+                data.columns[index_col] if isinstance(index_col, int) else index_col
+            )
+        return data
+
+    @classmethod
+    def iterate(
+        cls,
+        filepath: str,
+        chunksize: int = 100000,
+        usecols: List[str] = None,
+        where: dict = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yields the table as DataFrame chunks.
+
+        Args:
+            filepath (str): The CSV file.
+            chunksize (int): The maximum number of rows read per chunk.
+            usecols (list): Optional list of columns to return.
+            where (dict): Optional mapping of column name to the values to keep, for example
+                {"StudyInstanceUID": study_ids}. On the Parquet sidecar, the filter is pushed down
+                to pyarrow, which skips row groups whose statistics exclude the values and filters
+                the remaining rows before conversion to pandas. Otherwise, rows are filtered as
+                each chunk is read. Chunks with no remaining rows are skipped.
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError("File {} not found.".format(filepath))
+
+        where = where or {}
+        if cls.is_cached(filepath):
+            dataset = ds.dataset(cls.cache_filepath(filepath), format="parquet")
+            batches = dataset.to_batches(
+                columns=usecols, filter=cls._get_filter(where), batch_size=chunksize
+            )
+            for batch in batches:
+                if batch.num_rows > 0:
+                    yield batch.to_pandas()
+            return
+
+        columns = None
+        if usecols is not None:
+            columns = list(usecols) + [c for c in where.keys() if c not in usecols]
+
+        for chunk in pd.read_csv(filepath, chunksize=chunksize, usecols=columns):
+            for column, values in where.items():
+                chunk = chunk[chunk[column].isin(values)]
+            if len(chunk) > 0:
+                yield chunk[usecols] if usecols is not None else chunk
+
+    @classmethod
+    def _get_filter(cls, where: dict) -> Union[pc.Expression, None]:
+        """Returns the pyarrow expression keeping rows whose columns take one of the given values."""
+        expression = None
+        for column, values in where.items():
+            condition = pc.field(column).isin(pa.array(list(values)))
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    @classmethod
+    def cache_filepath(cls, filepath: str) -> str:
+        """Returns the filepath of the Parquet sidecar for a CSV file."""
+        return filepath + ".parquet"
+
+    @classmethod
+    def is_cached(cls, filepath: str) -> bool:
+        """Returns True if a sidecar exists and matches the source file's size and mtime."""
+        cache_filepath = cls.cache_filepath(filepath)
+        if not os.path.exists(cache_filepath):
+            return False
+        try:
+            metadata = pq.read_schema(cache_filepath).metadata or {}
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Ignoring unreadable cache {}\n{}".format(cache_filepath, e))
+            return False
+        return metadata.get(CSVIO.__cache_key) == cls._get_stamp(filepath)
+
+    @classmethod
+    def _get_stamp(cls, filepath: str) -> bytes:
+        stat = os.stat(filepath)
+        return json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}).encode()
+
+    @classmethod
+    def _read_cache(cls, filepath: str, usecols: List[str] = None) -> Union[pd.DataFrame, None]:
+        """Returns the cached table, or None if the sidecar is missing or stale."""
+        if not cls.is_cached(filepath):
+            return None
+        try:
+            return pq.read_table(cls.cache_filepath(filepath), columns=usecols).to_pandas()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Ignoring unreadable cache for {}\n{}".format(filepath, e))
+            return None
+
+    @classmethod
+    def _write_cache(cls, filepath: str, data: pd.DataFrame) -> None:
+        """Writes the sidecar to a temporary file and renames it over any previous sidecar."""
+        temp_filepath = None
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            metadata = {
+                **(table.schema.metadata or {}),
+                CSVIO.__cache_key: cls._get_stamp(filepath),
+            }
+            temp_filepath = cls._temp_filepath(cls.cache_filepath(filepath))
+            pq.write_table(table.replace_schema_metadata(metadata), temp_filepath)
+            os.replace(temp_filepath, cls.cache_filepath(filepath))
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Unable to write the cache for {}\n{}".format(filepath, e))
+        finally:
+            if temp_filepath is not None and os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+
+    @classmethod
+    def _compact(cls, data: pd.DataFrame) -> pd.DataFrame:
+        """Converts columns to categorical, and downcasts integers and floats."""
+        for column in data.columns:
+            series = data[column]
+            if pd.api.types.is_integer_dtype(series):
+                data[column] = pd.to_numeric(series, downcast="integer")
+            elif pd.api.types.is_float_dtype(series):
+                data[column] = pd.to_numeric(series, downcast="float")
+            elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                if (
+                    column in CSVIO.__categorical_columns
+                    or series.nunique() < CSVIO.__categorical_ratio * len(series)
+                ):
+                    data[column] = series.astype("category")
+        return data
 
     @classmethod
     def _write(
@@ -87,6 +343,21 @@ class CSVIO(IO):
         data.to_csv(filepath, sep=sep, index=index, index_label=index_label, encoding=encoding)
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                       PARQUET IO                                                 #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ParquetIO(IO):
+    @classmethod
+    def _read(cls, filepath: str, columns: List[str] = None, filters: list = None) -> pd.DataFrame:
+        return pd.read_parquet(filepath, columns=columns, filters=filters)
+
+    @classmethod
+    def _write(cls, filepath: str, data: pd.DataFrame, index: bool = False) -> None:
+        data.to_parquet(filepath, index=index)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                        YAML IO                                                   #
 # ------------------------------------------------------------------------------------------------ #
@@ -135,9 +406,60 @@ class PickleIO(IO):
 
 
 class NibabelIO(IO):
+    """Reads NIfTI volumes.
+
+    The default 'fdata' mode returns the full volume as float64 via ``get_fdata``. The 'native'
+    mode reads through the memory-mapped ``dataobj`` proxy and returns the stored voxels in their
+    on-disk dtype, without applying the header scl_slope and scl_inter. If ``dtype`` is provided,
+    the scaled voxels are returned in that dtype instead. The 'proxy' mode returns the ``dataobj`` proxy itself so
+    that callers can index it lazily, and the 'image' mode returns the image, whose affine and
+    header are available without reading any voxels.
+
+    In the array modes, ``slab`` restricts the read to a single index or a slice along ``axis``,
+    so only the voxels in that slab are read from disk.
+    """
+
+    __modes = ("fdata", "native", "proxy", "image")
+
     @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
-        return nib.load(filepath).get_fdata()
+    def _read(
+        cls,
+        filepath: str,
+        mode: str = "fdata",
+        dtype: Union[str, np.dtype] = None,
+        slab: Union[int, slice] = None,
+        axis: int = 2,
+        mmap: bool = True,
+    ) -> Any:
+        if mode not in NibabelIO.__modes:
+            raise ValueError("Invalid mode {}. Valid modes are {}.".format(mode, NibabelIO.__modes))
+
+        img = nib.load(filepath, mmap=mmap)
+
+        if mode == "proxy":
+            return img.dataobj
+        elif mode == "image":
+            return img
+
+        if mode == "fdata" and slab is None:
+            return img.get_fdata()
+
+        index = [slice(None)] * len(img.shape)
+        if slab is not None:
+            index[axis] = slab
+
+        if mode == "native" and dtype is None:
+            # Indexing the proxy applies scl_slope and scl_inter, which promotes scaled volumes to
+            # float, so the stored voxels are read unscaled.
+            return np.asanyarray(img.dataobj._get_unscaled(tuple(index)))
+
+        data = np.asanyarray(img.dataobj[tuple(index)])
+
+        if mode == "fdata":
+            return data.astype(np.float64, copy=False)
+        elif dtype is not None:
+            return data.astype(dtype, copy=False)
+        return data
 
     @classmethod
     def _write(cls, filepath: str, data: Any, **kwargs) -> None:
@@ -149,10 +471,95 @@ class NibabelIO(IO):
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class DicomImage:
+    """Decoded DICOM slice.
+
+    Args:
+        pixels (np.ndarray): The stored pixel values as int16, shifted into range if unsigned.
+        slope (float): The RescaleSlope used to convert pixel values to Hounsfield units.
+        intercept (float): The RescaleIntercept used to convert pixel values to Hounsfield units.
+        header (pydicom.Dataset): The DICOM dataset, without the PixelData element.
+    """
+
+    pixels: np.ndarray
+    slope: float = 1.0
+    intercept: float = 0.0
+    header: pydicom.Dataset = None
+
+
+# ------------------------------------------------------------------------------------------------ #
 class DicomIO(IO):
+    """Reads DICOM files.
+
+    The 'raw' mode returns the file bytes as a tensor. The 'pixels' mode decodes the image and
+    returns a DicomImage with int16 pixels and the rescale slope and intercept. Unsigned pixel data
+    with values above 32767 is shifted down by 32768 and the intercept raised to match, so the
+    rescaled values are unchanged. The 'header' mode parses the dataset up to, but not including,
+    the pixel data. The 'tags' mode does the same for only the requested ``tags`` and returns them
+    as python values in a dictionary keyed by tag keyword.
+    """
+
+    __modes = ("raw", "pixels", "header", "tags")
+    __unsigned_shift = 32768
+
+    @classmethod
+    def _read(
+        cls, filepath: str, mode: str = "raw", tags: List[str] = None
+    ) -> Union[tf.Tensor, DicomImage, pydicom.Dataset, dict]:
+        if mode not in DicomIO.__modes:
+            raise ValueError("Invalid mode {}. Valid modes are {}.".format(mode, DicomIO.__modes))
+
+        if mode == "raw":
+            return tf.io.read_file(filepath)
+
+        elif mode == "pixels":
+            dicom = pydicom.dcmread(filepath)
+            pixels = dicom.pixel_array
+            slope = float(dicom.get("RescaleSlope", 1.0))
+            intercept = float(dicom.get("RescaleIntercept", 0.0))
+            if (
+                pixels.dtype.kind == "u"
+                and pixels.size > 0
+                and pixels.max() > np.iinfo(np.int16).max
+            ):
+                # Unsigned values above the int16 range would wrap, so they are shifted into it
+                # and the shift is folded into the intercept, leaving the rescaled values intact.
+                pixels = (pixels.astype(np.int32) - DicomIO.__unsigned_shift).astype(np.int16)
+                intercept += DicomIO.__unsigned_shift * slope
+            else:
+                pixels = pixels.astype(np.int16, copy=False)
+            del dicom.PixelData
+            return DicomImage(pixels=pixels, slope=slope, intercept=intercept, header=dicom)
+
+        elif mode == "header":
+            return pydicom.dcmread(filepath, stop_before_pixels=True)
+
+        else:
+            if not tags:
+                raise ValueError("The 'tags' mode requires a list of tag keywords.")
+            dicom = pydicom.dcmread(filepath, stop_before_pixels=True, specific_tags=tags)
+            return {tag: cls._get_value(dicom, tag) for tag in tags}
+
     @classmethod
-    def _read(cls, filepath: str, **kwargs) -> tf.uint16:
-        return tf.io.read_file(filepath)
+    def _get_value(cls, dicom: pydicom.Dataset, tag: str) -> Any:
+        """Returns the value of a tag as a python type, or None if the tag is absent.
+
+        Integer strings (IS) are returned as int, decimal strings (DS) as float and multi-valued
+        elements as lists of these. Other values are returned as pydicom provides them.
+        """
+        value = dicom.get(tag)
+        if isinstance(value, MultiValue):
+            return [cls._to_python(v) for v in value]
+        return cls._to_python(value)
+
+    @classmethod
+    def _to_python(cls, value: Any) -> Any:
+        if isinstance(value, IS):
+            return int(value)
+        if isinstance(value, (DSfloat, DSdecimal)):
+            return float(value)
+        return value
 
     @classmethod
     def _write(cls, filepath: str, data: Any, **kwargs) -> None:
@@ -174,6 +581,124 @@ class H5IO(IO):
         data.save(filepath)
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                         VOLUME                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class VolumeIO(IO):
+    """Reads and writes preprocessed study volumes.
+
+    Each volume is stored in an HDF5 file as a 'volume' dataset chunked one slice per chunk and
+    optionally compressed. Metadata such as the study id and voxel spacing are stored as attributes
+    of the dataset. Reading a slice or slice range decompresses only the chunks for those slices.
+    With ``metadata=True``, only the attributes, shape and dtype are read.
+    """
+
+    __dataset = "volume"
+
+    @classmethod
+    def _read(
+        cls, filepath: str, slab: Union[int, slice] = None, metadata: bool = False
+    ) -> Union[np.ndarray, dict]:
+        with h5py.File(filepath, "r") as f:
+            dataset = f[VolumeIO.__dataset]
+            if metadata:
+                return {
+                    **{k: cls._from_attr(v) for k, v in dataset.attrs.items()},
+                    "shape": dataset.shape,
+                    "dtype": str(dataset.dtype),
+                }
+            return dataset[slab] if slab is not None else dataset[()]
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: np.ndarray,
+        compression: Union[str, None] = "lzf",
+        metadata: dict = None,
+    ) -> None:
+        with h5py.File(filepath, "w") as f:
+            dataset = f.create_dataset(
+                VolumeIO.__dataset,
+                data=data,
+                chunks=(1,) + data.shape[1:],
+                compression=compression,
+            )
+            for k, v in (metadata or {}).items():
+                dataset.attrs[k] = v
+
+    @classmethod
+    def _from_attr(cls, value: Any) -> Any:
+        """Converts HDF5 attribute values to python types."""
+        if isinstance(value, np.ndarray):
+            return tuple(value.tolist())
+        elif isinstance(value, np.generic):
+            return value.item()
+        return value
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          MASK                                                    #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class MaskIO(IO):
+    """Reads and writes run-length encoded label masks.
+
+    Masks are stored in an HDF5 file as the 'values', 'lengths' and 'offsets' datasets of an
+    RLEMask, with the shape, foreground box and slice axis as attributes. Arrays are encoded on
+    write. Reading with ``index`` reads the offsets and then only the runs of that slice, and
+    returns the decoded slice. Otherwise the whole mask is decoded, or returned as an RLEMask if
+    ``encoded`` is True.
+    """
+
+    __datasets = ("values", "lengths", "offsets")
+
+    @classmethod
+    def _read(
+        cls, filepath: str, index: int = None, encoded: bool = False
+    ) -> Union[np.ndarray, RLEMask]:
+        with h5py.File(filepath, "r") as f:
+            shape = tuple(f.attrs["shape"].tolist())
+            box = tuple(tuple(extent) for extent in f.attrs["box"].tolist())
+            axis = int(f.attrs["axis"])
+            if index is not None:
+                n_slices = shape[axis]
+                if not -n_slices <= index < n_slices:
+                    raise ValueError(
+                        "Slice index {} is out of range for a mask of {} slices.".format(
+                            index, n_slices
+                        )
+                    )
+                start, stop = f["offsets"][index % n_slices : index % n_slices + 2]  # noqa E203
+                return decode_runs(
+                    f["values"][start:stop], f["lengths"][start:stop], shape, box, axis
+                )
+            mask = RLEMask(
+                *(f[name][()] for name in MaskIO.__datasets), shape=shape, box=box, axis=axis
+            )
+        return mask if encoded else mask.decode()
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: Union[np.ndarray, RLEMask],
+        axis: int = 2,
+        compression: Union[str, None] = "lzf",
+    ) -> None:
+        mask = data if isinstance(data, RLEMask) else RLEMask.encode(data, axis=axis)
+        with h5py.File(filepath, "w") as f:
+            for name in MaskIO.__datasets:
+                array = getattr(mask, name)
+                f.create_dataset(name, data=array, compression=compression if array.size else None)
+            f.attrs["shape"] = mask.shape
+            f.attrs["box"] = np.asarray(mask.box, dtype=np.int64).reshape(-1, 2)
+            f.attrs["axis"] = mask.axis
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                       IO FACTORY                                                 #
 # ------------------------------------------------------------------------------------------------ #
@@ -181,6 +706,7 @@ class IOFactory:
 
     __io = {
         "csv": CSVIO,
+        "parquet": ParquetIO,
         "yaml": YamlIO,
         "yml": YamlIO,
         "pkl": PickleIO,
@@ -189,6 +715,10 @@ class IOFactory:
         "nib": NibabelIO,
         "dcm": DicomIO,
         "h5": H5IO,
+        "vol": VolumeIO,
+        "volume": VolumeIO,
+        "mask": MaskIO,
+        "rle": MaskIO,
     }
 
     @classmethod
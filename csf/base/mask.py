@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mask.py                                                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:43:48 pm                                                #
+# Modified   : Friday October 16th 2026 10:43:48 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Run-length encoded label masks."""
+import numpy as np
+from dataclasses import dataclass
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class RLEMask:
+    """Label mask stored as the bounding box of its foreground and runs of equal values within it.
+
+    Only the box enclosing the nonzero voxels is encoded. It is moved so the slice axis comes first
+    and flattened in C order, and every slice starts a new run, so each slice is decoded from its
+    own runs alone and offsets gives the position of the first run of each slice. Slices outside
+    the box have no runs. Segmentation masks are mostly background, so a mask takes a small
+    fraction of the bytes of the dense array, and encoding only transposes the box.
+
+    Args:
+        values (np.ndarray): The label of each run, in the dtype of the mask.
+        lengths (np.ndarray): The number of voxels in each run as uint32.
+        offsets (np.ndarray): The index of the first run of each slice followed by the number of
+            runs, as int64, so the runs of slice i are offsets[i]:offsets[i + 1].
+        shape (tuple): The shape of the decoded mask.
+        box (tuple): The (start, stop) of the foreground along each axis of the decoded mask.
+        axis (int): The slice axis of the decoded mask. Defaults to 2, the NIfTI slice axis.
+    """
+
+    values: np.ndarray
+    lengths: np.ndarray
+    offsets: np.ndarray
+    shape: tuple
+    box: tuple
+    axis: int = 2
+
+    @classmethod
+    def encode(cls, mask: np.ndarray, axis: int = 2) -> "RLEMask":
+        """Returns the run-length encoding of a mask with slices along axis and background 0."""
+        mask = np.asanyarray(mask)
+        axis = axis % mask.ndim
+        box = _foreground_box(mask, axis)
+        start, stop = box[axis]
+
+        flat = np.ascontiguousarray(
+            np.moveaxis(mask[tuple(slice(*extent) for extent in box)], axis, 0)
+        ).ravel()
+        slice_starts = np.arange(stop - start + 1, dtype=np.int64) * (
+            flat.size // max(stop - start, 1)
+        )
+        boundaries = np.empty(flat.size, dtype=bool)
+        boundaries[:1] = True
+        np.not_equal(flat[1:], flat[:-1], out=boundaries[1:])
+        boundaries[slice_starts[:-1]] = True
+        starts = np.flatnonzero(boundaries)
+
+        offsets = np.concatenate(
+            [
+                np.zeros(start, dtype=np.int64),
+                np.searchsorted(starts, slice_starts),
+                np.full(mask.shape[axis] - stop, len(starts), dtype=np.int64),
+            ]
+        )
+        return cls(
+            values=flat[starts],
+            lengths=np.diff(starts, append=flat.size).astype(np.uint32),
+            offsets=offsets.astype(np.int64),
+            shape=tuple(mask.shape),
+            box=box,
+            axis=axis,
+        )
+
+    @property
+    def n_slices(self) -> int:
+        return self.shape[self.axis]
+
+    @property
+    def n_runs(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes + self.lengths.nbytes + self.offsets.nbytes)
+
+    def decode(self) -> np.ndarray:
+        """Returns the dense mask."""
+        mask = np.zeros(self.shape, dtype=self.values.dtype)
+        extents = [stop - start for start, stop in self.box]
+        runs = np.repeat(self.values, self.lengths).reshape([extents.pop(self.axis)] + extents)
+        mask[tuple(slice(*extent) for extent in self.box)] = np.moveaxis(runs, 0, self.axis)
+        return mask
+
+    def decode_slice(self, index: int) -> np.ndarray:
+        """Returns a single slice of the dense mask, decoded from that slice's runs only."""
+        if not -self.n_slices <= index < self.n_slices:
+            raise ValueError(
+                "Slice index {} is out of range for a mask of {} slices.".format(
+                    index, self.n_slices
+                )
+            )
+        start, stop = self.offsets[index % self.n_slices : index % self.n_slices + 2]  # noqa E203
+        return decode_runs(
+            self.values[start:stop], self.lengths[start:stop], self.shape, self.box, self.axis
+        )
+
+
+def decode_runs(
+    values: np.ndarray, lengths: np.ndarray, shape: tuple, box: tuple, axis: int
+) -> np.ndarray:
+    """Returns a slice of a mask from its runs.
+
+    Args:
+        values (np.ndarray): The label of each run in the slice.
+        lengths (np.ndarray): The length of each run in the slice.
+        shape (tuple): The shape of the decoded mask.
+        box (tuple): The (start, stop) of the foreground along each axis of the decoded mask.
+        axis (int): The slice axis of the decoded mask.
+    """
+    shape, box = list(shape), list(box)
+    shape.pop(axis)
+    box.pop(axis)
+    image = np.zeros(shape, dtype=values.dtype)
+    if len(values) > 0:
+        image[tuple(slice(*extent) for extent in box)] = np.repeat(values, lengths).reshape(
+            [stop - start for start, stop in box]
+        )
+    return image
+
+
+def _foreground_box(mask: np.ndarray, axis: int) -> tuple:
+    """Returns the (start, stop) of the nonzero voxels along each axis, from two projections."""
+    in_plane = mask.any(axis=axis)
+    along = mask.any(axis=tuple(dim for dim in range(mask.ndim) if dim != axis))
+    projections = [
+        in_plane.any(axis=tuple(other for other in range(in_plane.ndim) if other != dim))
+        for dim in range(in_plane.ndim)
+    ]
+    projections.insert(axis, along)
+
+    box = []
+    for projection in projections:
+        occupied = np.flatnonzero(projection)
+        box.append((int(occupied[0]), int(occupied[-1]) + 1) if len(occupied) > 0 else (0, 0))
+    return tuple(box)
@@ -11,15 +11,18 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday October 27th 2022 02:34:47 pm                                              #
-# Modified   : Tuesday November 1st 2022 03:48:16 pm                                               #
+# Modified   : Friday October 16th 2026 10:34:35 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """Abstract base class for tasks."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any, Union
 
+from csf.utils.time import time_format
+
 # ------------------------------------------------------------------------------------------------ #
 
 
@@ -37,6 +40,10 @@ class Operator(ABC):
         for k, v in kwargs.items():
             setattr(self, k, v)
         self._skipped = False
+        self._started = None
+        self.started = None
+        self.ended = None
+        self.duration = None
 
     def __str__(self) -> str:
         return f"Operation: {self.__class__.__name__}\n\tAttributes: {self.__dict__.items()}"
@@ -44,6 +51,17 @@ class Operator(ABC):
     def __repr__(self) -> str:
         return f"Operation: {self.__class__.__name__}\n\tAttributes: {self.__dict__.items()}"
 
+    def setup(self) -> None:
+        """Records the start time."""
+        self._started = datetime.now()
+        self.started = self._started.strftime("%m/%d/%Y, %H:%M:%S")
+
+    def teardown(self) -> None:
+        """Records the end time and duration."""
+        ended = datetime.now()
+        self.ended = ended.strftime("%m/%d/%Y, %H:%M:%S")
+        self.duration = time_format((ended - self._started).total_seconds())
+
     @abstractmethod
     def execute(self, data: Any = None, context: dict = None) -> Any:
         """Call setup() and teardown() before and after in subclasses."""
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /service.py                                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 11:09:15 pm                                                #
+# Modified   : Friday October 16th 2026 11:09:15 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Abstract base class for services."""
+from abc import ABC
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class Service(ABC):
+    """Base class for stateless services such as IO, whose behavior is provided by classmethods."""
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /writer.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:28:01 pm                                                #
+# Modified   : Friday October 16th 2026 11:13:42 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Background writer for IO.write."""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class WriteBehind:
+    """Runs writes on a thread pool behind a bounded queue.
+
+    ``submit`` blocks when ``max_pending`` writes are queued or running, so producers cannot run
+    arbitrarily far ahead of the disk. Each write returns a Future. Exceptions raised by writes are
+    also collected and re-raised by ``flush``, so errors are surfaced even if the Future is dropped.
+    Data passed to a background write must not be modified until the write completes.
+
+    Args:
+        n_workers (int): The number of writer threads.
+        max_pending (int): The maximum number of queued and running writes.
+    """
+
+    def __init__(self, n_workers: int = 2, max_pending: int = 16) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="csf-write")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = set()
+        self._errors = []
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def flush(self) -> None:
+        """Waits for all pending writes and raises the first error since the last flush."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def shutdown(self) -> None:
+        """Waits for all pending writes, stops the writer threads, and raises any write error."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+            if future.exception() is not None:
+                self._errors.append(future.exception())
+        self._slots.release()
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday November 1st 2022 03:36:45 pm                                               #
-# Modified   : Tuesday November 1st 2022 03:42:49 pm                                               #
+# Modified   : Friday October 16th 2026 10:59:55 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
@@ -28,6 +28,82 @@ class SegmentationVertebraeExtractorConfig(Config):
     name: str = "segmentation_label_extractor"
     source: str = "input/segmentations/*.nii"
     target: str = "working/segmentation_metadata.csv"
+    manifest: str = None
+    alignment_filepath: str = "working/slice_alignment.parquet"
+    digest: bool = False
+    n_jobs: int = 12
+    verbose: int = 10
+    force: bool = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SegmentationBoxExtractorConfig(Config):
+    name: str = "segmentation_box_extractor"
+    source: str = "input/segmentations/*.nii"
+    target: str = "working/segmentation_boxes.csv"
+    alignment_filepath: str = "working/slice_alignment.parquet"
+    n_jobs: int = 12
+    verbose: int = 10
+    force: bool = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class StudyPreprocessorConfig(Config):
+    name: str = "study_preprocessor"
+    source: str = "data/raw/train_images"
+    target: str = "data/processed/train_images"
+    window: tuple = (1800, 400)
+    output_shape: tuple = (256, 256)
+    n_threads: int = 4
+    n_jobs: int = 12
+    verbose: int = 10
+    force: bool = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class TFRecordExporterConfig(Config):
+    name: str = "tfrecord_exporter"
+    source: str = "data/processed/train_images"
+    target: str = "data/processed/tfrecords"
+    labels_filepath: str = "data/raw/train.csv"
+    segmentation_filepath: str = "working/segmentation_metadata.csv"
+    shard_size: int = 4096
+    compression: str = "GZIP"
+    force: bool = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SliceLabelBuilderConfig(Config):
+    name: str = "slice_label_builder"
+    segmentation_filepath: str = "working/segmentation_metadata.csv"
+    labels_filepath: str = "data/raw/train.csv"
+    boxes_filepath: str = "data/raw/train_bounding_boxes.csv"
+    target: str = "working/slice_labels.parquet"
+    force: bool = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class SliceAlignmentBuilderConfig(Config):
+    name: str = "slice_alignment_builder"
+    source: str = "input/segmentations/*.nii"
+    dicom_directory: str = "data/raw/train_images"
+    target: str = "working/slice_alignment.parquet"
+    n_threads: int = 4
     n_jobs: int = 12
     verbose: int = 10
     force: bool = False
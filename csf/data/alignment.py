@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /alignment.py                                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:48:05 pm                                                #
+# Modified   : Friday October 16th 2026 10:59:56 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Alignment Module: Maps segmentation NIfTI slices to DICOM slices."""
+import os
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import List
+
+from csf.base.io import IOFactory
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+ALIGNMENT_FILEPATH = "working/slice_alignment.parquet"
+LPS_TO_RAS = np.array([-1.0, -1.0, 1.0])
+# ------------------------------------------------------------------------------------------------ #
+
+
+def align_slices(
+    affine: np.ndarray, n_slices: int, instance_numbers: np.ndarray, positions: np.ndarray
+) -> pd.DataFrame:
+    """Returns the DICOM slice nearest to each slice of a NIfTI volume.
+
+    Both sets of slices are located by their offset along the normal of the NIfTI slice planes.
+    The offset of NIfTI slice k is that of the voxel (0, 0, k) under the affine, and that of a
+    DICOM slice is that of its ImagePositionPatient converted from LPS to RAS. Since both points
+    lie in their slice planes, the offsets do not depend on the in-plane orientation of either
+    volume. Each NIfTI slice is matched to the DICOM slice with the nearest offset.
+
+    Args:
+        affine (np.ndarray): The 4x4 NIfTI voxel to RAS affine.
+        n_slices (int): The number of NIfTI slices along the third voxel axis.
+        instance_numbers (np.ndarray): The InstanceNumber of each DICOM slice.
+        positions (np.ndarray): The ImagePositionPatient of each DICOM slice, shape (slices, 3).
+
+    Returns:
+        DataFrame with nifti_slice (int16), instance_number (int32) and distance (float32), the
+        distance in mm between the matched slice planes, with one row per NIfTI slice.
+    """
+    affine = np.asarray(affine, dtype=np.float64)
+    normal = affine[:3, 2] / np.linalg.norm(affine[:3, 2])
+    nifti_offsets = affine[:3, 3] @ normal + np.arange(n_slices) * (affine[:3, 2] @ normal)
+    dicom_offsets = (np.asarray(positions, dtype=np.float64) * LPS_TO_RAS) @ normal
+
+    order = np.argsort(dicom_offsets, kind="stable")
+    nearest = np.zeros(n_slices, dtype=np.int64)
+    if len(order) > 1:
+        sorted_offsets = dicom_offsets[order]
+        right = np.clip(np.searchsorted(sorted_offsets, nifti_offsets), 1, len(order) - 1)
+        left = right - 1
+        nearest = np.where(
+            np.abs(nifti_offsets - sorted_offsets[left])
+            <= np.abs(sorted_offsets[right] - nifti_offsets),
+            left,
+            right,
+        )
+    nearest = order[nearest]
+
+    return pd.DataFrame(
+        {
+            "nifti_slice": np.arange(n_slices, dtype=np.int16),
+            "instance_number": np.asarray(instance_numbers, dtype=np.int32)[nearest],
+            "distance": np.abs(nifti_offsets - dicom_offsets[nearest]).astype(np.float32),
+        }
+    )
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SliceAlignment:
+    """Mapping between the NIfTI slices and DICOM slices of a study.
+
+    Args:
+        study_id (str): The StudyInstanceUID.
+        instance_numbers (np.ndarray): The DICOM InstanceNumber of each NIfTI slice.
+        nifti_slices (np.ndarray): The NIfTI slice of each InstanceNumber, indexed by
+            InstanceNumber, or -1 for DICOM slices without a NIfTI slice.
+    """
+
+    study_id: str
+    instance_numbers: np.ndarray
+    nifti_slices: np.ndarray
+
+    @classmethod
+    def from_table(cls, study_id: str, table: pd.DataFrame) -> "SliceAlignment":
+        """Creates the mapping from align_slices output for one study.
+
+        When several NIfTI slices match the same DICOM slice, the nearest is kept for the reverse
+        mapping.
+        """
+        table = table.sort_values("nifti_slice")
+        instance_numbers = table["instance_number"].to_numpy(dtype=np.int32)
+        nearest = table.sort_values("distance", ascending=False, kind="stable")
+        nifti_slices = np.full(int(instance_numbers.max(initial=0)) + 1, -1, dtype=np.int32)
+        nifti_slices[nearest["instance_number"].to_numpy()] = nearest["nifti_slice"].to_numpy()
+        return cls(study_id=study_id, instance_numbers=instance_numbers, nifti_slices=nifti_slices)
+
+    @property
+    def reversed(self) -> bool:
+        """True if NIfTI slices run in the opposite order to DICOM InstanceNumber."""
+        return len(self.instance_numbers) > 1 and (
+            self.instance_numbers[-1] < self.instance_numbers[0]
+        )
+
+    def to_dicom(self, nifti_slice: int) -> int:
+        """Returns the InstanceNumber of the DICOM slice matching a NIfTI slice."""
+        if not 0 <= nifti_slice < len(self.instance_numbers):
+            raise ValueError(
+                "NIfTI slice {} is out of range for study {} with {} slices.".format(
+                    nifti_slice, self.study_id, len(self.instance_numbers)
+                )
+            )
+        return int(self.instance_numbers[nifti_slice])
+
+    def to_nifti(self, instance_number: int) -> int:
+        """Returns the NIfTI slice matching a DICOM InstanceNumber, or -1 if there is none."""
+        if 0 <= instance_number < len(self.nifti_slices):
+            return int(self.nifti_slices[instance_number])
+        return -1
+
+
+# ------------------------------------------------------------------------------------------------ #
+class AlignmentIndex:
+    """Persisted NIfTI to DICOM slice alignment for all segmented studies.
+
+    The index is the Parquet table written by SliceAlignmentBuilder, with one row per NIfTI slice.
+    It is loaded once, and the SliceAlignment of each study is built on first use, after which
+    lookups in either direction are O(1) array indexing with no header reads.
+
+    Args:
+        filepath (str): The alignment table written by SliceAlignmentBuilder.
+    """
+
+    def __init__(self, filepath: str = ALIGNMENT_FILEPATH) -> None:
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(
+                "Alignment index {} not found. Run SliceAlignmentBuilder to build it.".format(
+                    filepath
+                )
+            )
+        self._table = IOFactory.create("parquet").read(filepath)
+        self._rows = self._table.groupby("StudyInstanceUID", sort=False, observed=True).indices
+        self._alignments = {}
+
+    @property
+    def studies(self) -> List[str]:
+        return list(self._rows.keys())
+
+    def __contains__(self, study_id: str) -> bool:
+        return study_id in self._rows
+
+    def get(self, study_id: str) -> SliceAlignment:
+        """Returns the alignment of a study."""
+        if study_id not in self._alignments:
+            try:
+                rows = self._rows[study_id]
+            except KeyError as e:
+                raise ValueError("Study {} is not in the alignment index.\n{}".format(study_id, e))
+            self._alignments[study_id] = SliceAlignment.from_table(study_id, self._table.iloc[rows])
+        return self._alignments[study_id]
+
+    def to_dicom(self, study_id: str, nifti_slice: int) -> int:
+        """Returns the InstanceNumber of the DICOM slice matching a NIfTI slice."""
+        return self.get(study_id).to_dicom(nifti_slice)
+
+    def to_nifti(self, study_id: str, instance_number: int) -> int:
+        """Returns the NIfTI slice matching a DICOM InstanceNumber, or -1 if there is none."""
+        return self.get(study_id).to_nifti(instance_number)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /cache.py                                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:26:23 pm                                                #
+# Modified   : Friday October 16th 2026 11:15:03 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Content-addressed disk cache for transform outputs."""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import numpy as np
+from typing import Any, Callable, List, Tuple, Union
+
+from csf.utils.file import file_digest
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+TRANSFORM_CACHE_DIR = "data/cache/transforms"
+# ------------------------------------------------------------------------------------------------ #
+
+
+class TransformCache:
+    """Persists transform outputs keyed by the source file digest and the transform parameters.
+
+    The key for each step in a pipeline is a hash of the previous step's key, the step name and
+    its parameters, with the source file digest at the root of the chain. A rerun with changed
+    parameters for a later step therefore reuses the cached outputs of the earlier steps. Outputs
+    are stored as .npy files and, when the cache exceeds ``max_bytes``, the least recently used
+    files are evicted.
+
+    Args:
+        directory (str): The cache directory.
+        max_bytes (int): The maximum total size of the cached files in bytes.
+    """
+
+    def __init__(
+        self, directory: str = TRANSFORM_CACHE_DIR, max_bytes: int = 10 * 1024**3
+    ) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._digests = {}
+        os.makedirs(directory, exist_ok=True)
+        self._nbytes = sum(os.path.getsize(filepath) for filepath in self._filepaths())
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def digest(self, filepath: str) -> str:
+        """Returns the sha256 digest of a file's content, memoized by path, mtime and size."""
+        stat = os.stat(filepath)
+        memo = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        if memo not in self._digests:
+            self._digests[memo] = file_digest(filepath)
+        return self._digests[memo]
+
+    @staticmethod
+    def key(parent: str, name: str, params: dict = None) -> str:
+        """Returns the key for a transform applied to the output identified by parent."""
+        params = json.dumps(params or {}, sort_keys=True, default=TransformCache._encode)
+        return hashlib.sha256("{}|{}|{}".format(parent, name, params).encode()).hexdigest()
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        """Returns a JSON serializable stand-in for a parameter value.
+
+        Arrays are identified by their dtype, shape and a digest of their bytes, since their repr
+        elides all but the edges of large arrays. Other values fall back to their repr.
+        """
+        if isinstance(value, np.ndarray):
+            data = np.ascontiguousarray(value)
+            return {
+                "dtype": data.dtype.str,
+                "shape": list(data.shape),
+                "sha256": hashlib.sha256(data.tobytes()).hexdigest(),
+            }
+        if isinstance(value, np.generic):
+            return value.item()
+        return repr(value)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._filepath(key))
+
+    def get(self, key: str) -> Union[np.ndarray, None]:
+        """Returns the cached array, or None on a miss. A hit marks the entry as recently used."""
+        filepath = self._filepath(key)
+        try:
+            data = np.load(filepath)
+        except FileNotFoundError:
+            return None
+        os.utime(filepath)
+        return data
+
+    def put(self, key: str, data: Any) -> None:
+        """Stores an array atomically, then evicts least recently used entries over budget."""
+        filepath = self._filepath(key)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        fd, tempfile_path = tempfile.mkstemp(dir=os.path.dirname(filepath), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(data))
+            if os.path.exists(filepath):
+                self._nbytes -= os.path.getsize(filepath)
+            os.replace(tempfile_path, filepath)
+        finally:
+            if os.path.exists(tempfile_path):
+                os.remove(tempfile_path)
+        self._nbytes += os.path.getsize(filepath)
+        if self._nbytes > self._max_bytes:
+            self._evict()
+
+    def run(
+        self,
+        filepath: str,
+        load: Callable[[str], Any],
+        steps: List[Tuple[str, Callable, dict]],
+    ) -> np.ndarray:
+        """Runs a pipeline of transforms on a source file, skipping steps already cached.
+
+        Args:
+            filepath (str): The source file.
+            load (Callable): Function that reads the source file, e.g. pydicom.dcmread.
+            steps (list): Sequence of (name, transform, params) tuples. Each transform is called
+                with the previous step's output followed by params as keyword arguments.
+
+        Returns the output of the last step.
+        """
+        keys = []
+        parent = self.digest(filepath)
+        for name, _, params in steps:
+            parent = self.key(parent, name, params)
+            keys.append(parent)
+
+        data, start = None, 0
+        for i in reversed(range(len(steps))):
+            data = self.get(keys[i])
+            if data is not None:
+                start = i + 1
+                break
+
+        if start == 0:
+            data = load(filepath)
+        for i in range(start, len(steps)):
+            _, transform, params = steps[i]
+            data = np.asarray(transform(data, **(params or {})))
+            self.put(keys[i], data)
+        logger.debug(
+            "Computed {} of {} steps for {}".format(len(steps) - start, len(steps), filepath)
+        )
+        return data
+
+    def clear(self) -> None:
+        for filepath in self._filepaths():
+            os.remove(filepath)
+        self._nbytes = 0
+
+    def _evict(self) -> None:
+        entries = sorted(
+            ((os.path.getmtime(filepath), filepath) for filepath in self._filepaths()),
+            key=lambda entry: entry[0],
+        )
+        for _, filepath in entries:
+            if self._nbytes <= self._max_bytes:
+                break
+            self._nbytes -= os.path.getsize(filepath)
+            os.remove(filepath)
+
+    def _filepath(self, key: str) -> str:
+        return os.path.join(self._directory, key[:2], key + ".npy")
+
+    def _filepaths(self) -> List[str]:
+        filepaths = []
+        for root, _, filenames in os.walk(self._directory):
+            filepaths.extend(os.path.join(root, f) for f in filenames if f.endswith(".npy"))
+        return filepaths
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /dataset.py                                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:35:01 pm                                                #
+# Modified   : Friday October 16th 2026 10:56:50 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Dataset Module: Builds distributed tf.data input pipelines over the preprocessed studies."""
+import os
+from glob import glob
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+from typing import Union
+
+from csf.base.io import IOFactory
+from csf.config.runtime import RuntimeConfig
+from csf.data.transforms import window_bounds
+
+# ------------------------------------------------------------------------------------------------ #
+PREPROCESSED_SCANS_DIR = "data/processed/train_images"
+TRAIN_TARGETS_FILEPATH = "data/raw/train.csv"
+TARGETS = ["patient_overall", "C1", "C2", "C3", "C4", "C5", "C6", "C7"]
+# ------------------------------------------------------------------------------------------------ #
+
+
+class DatasetBuilder:
+    """Builds sharded tf.data pipelines of labelled slices from the preprocessed study volumes.
+
+    Volumes written by StudyPreprocessor are joined with the study targets in train.csv. The
+    dataset function is passed to the runtime strategy's ``distribute_datasets_from_function``, so
+    each input pipeline reads its own shard of the studies. Within a pipeline, the study order is
+    shuffled each epoch when training, volumes are read and normalized by a parallel map,
+    optionally cached, and their slices are interleaved ``runtime.num_workers`` studies at a time,
+    shuffled and repeated when training, batched per replica, and prefetched. Parallelism and
+    prefetch depth are autotuned.
+
+    Caching stores every normalized float32 slice of the shard, about 256 KB per 256x256 slice or
+    roughly 75 MB per study, so an in-memory cache of the full training set needs far more memory
+    than a worker has. It is off by default; a file prefix caches to local disk instead. Since a
+    cache replays the study order of the first epoch, cached studies are reshuffled each epoch
+    within a buffer of study_buffer studies, which costs no memory for an in-memory cache and
+    study_buffer volumes for a file cache.
+
+    Args:
+        runtime (RuntimeConfig): Provides the distribution strategy and the number of workers.
+        directory (str): Directory of preprocessed '<StudyInstanceUID>.vol' volumes.
+        labels_filepath (str): The train.csv file with the study targets.
+        global_batch_size (int): The batch size across all replicas.
+        cache (Union[bool, str]): True caches in memory, a string caches to that file prefix,
+            False disables caching. Defaults to False.
+        shuffle_buffer (int): The slice shuffle buffer size when training.
+        study_buffer (int): The study shuffle buffer size after a cache when training.
+        seed (int): Seed for shuffling.
+    """
+
+    def __init__(
+        self,
+        runtime: RuntimeConfig,
+        directory: str = PREPROCESSED_SCANS_DIR,
+        labels_filepath: str = TRAIN_TARGETS_FILEPATH,
+        global_batch_size: int = 32,
+        cache: Union[bool, str] = False,
+        shuffle_buffer: int = 2048,
+        study_buffer: int = 16,
+        seed: int = None,
+    ) -> None:
+        self._runtime = runtime
+        self._directory = directory
+        self._labels_filepath = labels_filepath
+        self._global_batch_size = global_batch_size
+        self._cache = cache
+        self._shuffle_buffer = shuffle_buffer
+        self._study_buffer = study_buffer
+        self._seed = seed
+        self._io = IOFactory.create("vol")
+        self._studies = None
+
+    @property
+    def studies(self) -> pd.DataFrame:
+        """Studies with both a preprocessed volume and targets, with their filepaths."""
+        if self._studies is None:
+            filepaths = sorted(glob(os.path.join(self._directory, "*.vol")))
+            volumes = pd.DataFrame(
+                {
+                    "StudyInstanceUID": [os.path.basename(f)[: -len(".vol")] for f in filepaths],
+                    "filepath": filepaths,
+                }
+            )
+            labels = IOFactory.create("csv").read(self._labels_filepath, cache=True)
+            labels["StudyInstanceUID"] = labels["StudyInstanceUID"].astype(str)
+            self._studies = volumes.merge(
+                labels[["StudyInstanceUID"] + TARGETS], on="StudyInstanceUID"
+            )
+            if len(self._studies) == 0:
+                raise FileNotFoundError(
+                    "No labelled preprocessed volumes found in {}.".format(self._directory)
+                )
+        return self._studies
+
+    def build(self, training: bool = True) -> tf.distribute.DistributedDataset:
+        """Returns the dataset distributed across the runtime strategy's replicas."""
+        return self._runtime.strategy.distribute_datasets_from_function(
+            lambda input_context: self.dataset(input_context, training=training)
+        )
+
+    def dataset(
+        self, input_context: tf.distribute.InputContext = None, training: bool = True
+    ) -> tf.data.Dataset:
+        """Returns the dataset for one input pipeline.
+
+        Args:
+            input_context (tf.distribute.InputContext): Identifies the pipeline's shard and the
+                per-replica batch size. If None, a single pipeline reads every study.
+            training (bool): Whether to shuffle and drop the last partial batch.
+        """
+        input_context = input_context or tf.distribute.InputContext()
+        studies = self.studies
+        metadata = self._io.read(studies["filepath"].iloc[0], metadata=True)
+        rows, cols = metadata["shape"][1:]
+        img_min, img_max = window_bounds(metadata["window"])
+
+        files = tf.data.Dataset.from_tensor_slices(
+            (studies["filepath"].values, studies[TARGETS].values.astype(np.float32))
+        )
+        files = files.shard(input_context.num_input_pipelines, input_context.input_pipeline_id)
+        if training:
+            files = files.shuffle(len(studies), seed=self._seed, reshuffle_each_iteration=True)
+
+        def read_study(filepath: tf.Tensor, targets: tf.Tensor) -> tuple:
+            volume = tf.numpy_function(self._read_volume, [filepath], tf.float32)
+            volume.set_shape([None, rows, cols])
+            volume = (volume - img_min) / (img_max - img_min)
+            return volume[..., tf.newaxis], targets
+
+        def to_slices(volume: tf.Tensor, targets: tf.Tensor) -> tf.data.Dataset:
+            slices = tf.data.Dataset.from_tensor_slices(volume)
+            return slices.map(lambda image: (image, targets))
+
+        volumes = files.map(
+            read_study, num_parallel_calls=tf.data.AUTOTUNE, deterministic=not training
+        )
+        if self._cache:
+            volumes = volumes.cache(self._cache if isinstance(self._cache, str) else "")
+            if training:
+                volumes = volumes.shuffle(
+                    self._study_buffer, seed=self._seed, reshuffle_each_iteration=True
+                )
+        dataset = volumes.interleave(
+            to_slices,
+            cycle_length=self._runtime.num_workers,
+            num_parallel_calls=tf.data.AUTOTUNE,
+            deterministic=not training,
+        )
+        if training:
+            dataset = dataset.shuffle(self._shuffle_buffer, seed=self._seed)
+            dataset = dataset.repeat()
+        batch_size = input_context.get_per_replica_batch_size(self._global_batch_size)
+        dataset = dataset.batch(batch_size, drop_remainder=training)
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+    def _read_volume(self, filepath: bytes) -> np.ndarray:
+        return self._io.read(filepath.decode()).astype(np.float32, copy=False)
@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /etl.py                                                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:34:12 pm                                                #
+# Modified   : Friday October 16th 2026 11:15:03 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""ETL Module"""
+import os
+import logging
+from glob import glob
+from time import perf_counter
+from joblib import Parallel, delayed
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+from typing import Any, Union
+
+from csf.base.io import IOFactory
+from csf.base.operator import Operator
+from csf.config.etl import (
+    SegmentationVertebraeExtractorConfig,
+    SegmentationBoxExtractorConfig,
+    StudyPreprocessorConfig,
+    TFRecordExporterConfig,
+    SliceLabelBuilderConfig,
+    SliceAlignmentBuilderConfig,
+)
+from csf.data.study import StudyLoader
+from csf.data.preprocess import preprocess_study
+from csf.data.tfrecord import serialize_slice, TARGETS, VERTEBRAE
+from csf.data.labels import build_slice_labels, vertebra_boxes
+from csf.data.alignment import align_slices, AlignmentIndex
+from csf.utils.file import file_digest
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SegmentationVertebraeExtractor(Operator):
+    """Extracts the presence of each of C1-C7 in every slice of the segmentation volumes.
+
+    The NIfTI files matching source are processed in a pool of n_jobs processes. Each volume is
+    read in its native dtype and reduced to a per-slice label histogram with one bincount per
+    slab of slices, without per-slice or per-label loops. The output CSV in target has one row per
+    slice with StudyInstanceUID, SliceNumber and C1-C7 columns. SliceNumber is the DICOM
+    InstanceNumber of each NIfTI slice, mapped through the AlignmentIndex in alignment_filepath
+    built by SliceAlignmentBuilder. Studies without an alignment are assumed to run in the reverse
+    order of the DICOM slices, with a warning.
+
+    Extraction is incremental. The manifest CSV, '<target>.manifest.csv' unless given, records the
+    target and the path, size and modification time of each processed file, and its sha256 digest
+    if digest is True. A manifest recorded for another target is ignored and the target rebuilt,
+    so targets never share state. On each run only added files and
+    files whose size or modification time changed are extracted, and their rows replace any
+    previous ones in target. When digest is True, a file whose stats changed but whose content did
+    not is not extracted again. Rows of files no longer matching source are dropped. force
+    extracts every file, and is needed after the alignment index is rebuilt.
+
+    Keyword arguments override the SegmentationVertebraeExtractorConfig defaults. input_path and
+    output_path are accepted as aliases for source and target.
+    """
+
+    __manifest_columns = ["filepath", "StudyInstanceUID", "size", "mtime_ns", "digest", "target"]
+
+    def __init__(self, **kwargs) -> None:
+        params = {**SegmentationVertebraeExtractorConfig().as_dict(), **kwargs}
+        params["source"] = kwargs.get("input_path", params["source"])
+        params["target"] = kwargs.get("output_path", params["target"])
+        super().__init__(**params)
+        self.manifest = self.manifest or self.target + ".manifest.csv"
+        self.n_extracted = 0
+        self.n_unchanged = 0
+        self.n_removed = 0
+
+    def execute(self, data: Any = None, context: dict = None) -> pd.DataFrame:
+        self.setup()
+
+        filepaths = sorted(glob(self.source))
+        if not filepaths:
+            msg = "No segmentations match {}.".format(self.source)
+            logger.error(msg)
+            raise ValueError(msg)
+
+        current = self._stat(filepaths)
+        previous, vertebrae = self._read_previous()
+        changed = self._changed(current, previous)
+
+        studies = set(current["StudyInstanceUID"])
+        removed = set(previous["StudyInstanceUID"]) - studies
+        self.n_extracted = len(changed)
+        self.n_unchanged = len(current) - len(changed)
+        self.n_removed = len(removed)
+        logger.info(
+            "Extracting vertebrae from {} segmentations. {} unchanged, {} removed.".format(
+                self.n_extracted, self.n_unchanged, self.n_removed
+            )
+        )
+
+        if self.n_extracted > 0 or self.n_removed > 0 or vertebrae is None:
+            alignment = _load_alignment(self.alignment_filepath)
+            tables = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+                delayed(_extract_vertebrae)(filepath, _slice_numbers(alignment, filepath))
+                for filepath in changed
+            )
+            if vertebrae is not None:
+                keep = set(studies) - set(current.loc[changed, "StudyInstanceUID"])
+                tables.insert(0, vertebrae[vertebrae["StudyInstanceUID"].isin(keep)])
+            vertebrae = pd.concat(tables, ignore_index=True).sort_values(
+                ["StudyInstanceUID", "SliceNumber"], ascending=[True, False], ignore_index=True
+            )
+            IOFactory.create("csv").write(self.target, vertebrae)
+        else:
+            self._skipped = True
+        IOFactory.create("csv").write(self.manifest, current.reset_index())
+
+        self.teardown()
+        return vertebrae
+
+    def return_code(self) -> Union[bool, str]:
+        return self.ended is not None
+
+    def _stat(self, filepaths: list) -> pd.DataFrame:
+        """Returns the manifest entries of the files in source, indexed by filepath."""
+        stats = [os.stat(filepath) for filepath in filepaths]
+        return pd.DataFrame(
+            {
+                "filepath": filepaths,
+                "StudyInstanceUID": [_study_id(filepath) for filepath in filepaths],
+                "size": [stat.st_size for stat in stats],
+                "mtime_ns": [stat.st_mtime_ns for stat in stats],
+                "digest": "",
+                "target": os.path.abspath(self.target),
+            },
+            columns=self.__manifest_columns,
+        ).set_index("filepath")
+
+    def _read_previous(self) -> tuple:
+        """Returns the previous manifest and output, or an empty manifest and None if rebuilding."""
+        if self.force or not os.path.exists(self.target) or not os.path.exists(self.manifest):
+            previous = pd.DataFrame(columns=self.__manifest_columns).set_index("filepath")
+            return previous, None
+        previous = IOFactory.create("csv").read(self.manifest, index_col="filepath")
+        previous["StudyInstanceUID"] = previous["StudyInstanceUID"].astype(str)
+        previous["digest"] = previous["digest"].fillna("").astype(str)
+        if "target" not in previous or (previous["target"] != os.path.abspath(self.target)).any():
+            logger.info(
+                "Manifest {} was recorded for another target. Rebuilding {}.".format(
+                    self.manifest, self.target
+                )
+            )
+            return previous.iloc[:0], None
+        vertebrae = IOFactory.create("csv").read(self.target)
+        vertebrae["StudyInstanceUID"] = vertebrae["StudyInstanceUID"].astype(str)
+        return previous, vertebrae
+
+    def _changed(self, current: pd.DataFrame, previous: pd.DataFrame) -> list:
+        """Returns the files in current that are new or changed since previous.
+
+        Digests are carried over for unchanged files and computed only for the others.
+        """
+        known = previous.reindex(current.index)
+        same = (known["size"] == current["size"]) & (known["mtime_ns"] == current["mtime_ns"])
+        current.loc[same, "digest"] = known.loc[same, "digest"]
+        changed = list(current.index[~same])
+        if not self.digest:
+            return changed
+
+        for filepath in changed:
+            current.loc[filepath, "digest"] = file_digest(filepath)
+        for filepath in current.index[same & (current["digest"] == "")]:
+            current.loc[filepath, "digest"] = file_digest(filepath)
+        return [
+            filepath
+            for filepath in changed
+            if known.loc[filepath, "digest"] != current.loc[filepath, "digest"]
+        ]
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SegmentationBoxExtractor(Operator):
+    """Extracts per-slice, per-vertebra bounding boxes and voxel counts from segmentations.
+
+    The NIfTI files matching source are processed in a pool of n_jobs processes with
+    vertebra_boxes. The output CSV in target has the train_bounding_boxes.csv columns
+    StudyInstanceUID, x, y, width, height and slice_number, followed by vertebra and n_voxels,
+    with one row per vertebra present in a slice. slice_number is mapped through the
+    AlignmentIndex in alignment_filepath, as in SegmentationVertebraeExtractor. An existing target
+    is returned unless force is True. Keyword arguments override the
+    SegmentationBoxExtractorConfig defaults.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**{**SegmentationBoxExtractorConfig().as_dict(), **kwargs})
+
+    def execute(self, data: Any = None, context: dict = None) -> pd.DataFrame:
+        self.setup()
+        if os.path.exists(self.target) and not self.force:
+            self._skipped = True
+            boxes = IOFactory.create("csv").read(self.target)
+        else:
+            filepaths = sorted(glob(self.source))
+            if not filepaths:
+                msg = "No segmentations match {}.".format(self.source)
+                logger.error(msg)
+                raise ValueError(msg)
+            alignment = _load_alignment(self.alignment_filepath)
+            tables = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+                delayed(_extract_boxes)(filepath, _slice_numbers(alignment, filepath))
+                for filepath in filepaths
+            )
+            boxes = pd.concat(tables, ignore_index=True)
+            IOFactory.create("csv").write(self.target, boxes)
+            logger.info(
+                "Extracted {} vertebra boxes from {} segmentations.".format(
+                    len(boxes), len(filepaths)
+                )
+            )
+        self.teardown()
+        return boxes
+
+    def return_code(self) -> Union[bool, str]:
+        return self.ended is not None
+
+
+# ------------------------------------------------------------------------------------------------ #
+class StudyPreprocessor(Operator):
+    """Preprocesses the raw DICOM studies in source into volumes in target.
+
+    Each study is loaded, converted to Hounsfield units, windowed, cropped and resized with
+    preprocess_study, and written as '<StudyInstanceUID>.vol' with VolumeIO. Studies are processed
+    in a pool of n_jobs processes. Since volumes are written atomically, a study whose volume
+    exists is complete and is skipped unless force is True, so an interrupted run resumes where
+    it stopped. Keyword arguments override the StudyPreprocessorConfig defaults.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**{**StudyPreprocessorConfig().as_dict(), **kwargs})
+        self.n_studies = 0
+        self.n_skipped = 0
+        self.nbytes = 0
+        self.studies_per_second = 0.0
+        self.bytes_per_second = 0.0
+
+    def execute(self, data: Any = None, context: dict = None) -> None:
+        self.setup()
+
+        studies = sorted(entry.name for entry in os.scandir(self.source) if entry.is_dir())
+        todo = [
+            study for study in studies if self.force or not os.path.exists(self.filepath(study))
+        ]
+        self.n_skipped = len(studies) - len(todo)
+        logger.info(
+            "Preprocessing {} studies. Skipping {} already preprocessed.".format(
+                len(todo), self.n_skipped
+            )
+        )
+
+        start = perf_counter()
+        nbytes = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+            delayed(_preprocess)(
+                source=self.source,
+                filepath=self.filepath(study),
+                study_id=study,
+                window=tuple(self.window),
+                output_shape=tuple(self.output_shape),
+                n_threads=self.n_threads,
+            )
+            for study in todo
+        )
+        elapsed = perf_counter() - start
+
+        self.n_studies = len(todo)
+        self.nbytes = int(sum(nbytes))
+        self.studies_per_second = self.n_studies / elapsed if elapsed > 0 else 0.0
+        self.bytes_per_second = self.nbytes / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            "Preprocessed {} studies ({:,} bytes) at {:.2f} studies/sec, {:,.0f} bytes/sec.".format(
+                self.n_studies, self.nbytes, self.studies_per_second, self.bytes_per_second
+            )
+        )
+
+        self.teardown()
+
+    def filepath(self, study_id: str) -> str:
+        """Returns the filepath of a study's preprocessed volume."""
+        return os.path.join(self.target, study_id + ".vol")
+
+    def return_code(self) -> Union[bool, str]:
+        return self.ended is not None
+
+
+# ------------------------------------------------------------------------------------------------ #
+class TFRecordExporter(Operator):
+    """Exports the preprocessed slices to sharded TFRecord files.
+
+    Each record holds one slice with its study id, slice number, per-slice C1-C7 presence from
+    the segmentation metadata (-1 where the study has no segmentation), and the study's
+    patient_overall and C1-C7 targets. See csf.data.tfrecord.parse_example for reading records.
+    Shards hold at most shard_size records and are named 'slices-00000.tfrecord' and so on. A
+    manifest.csv in target records the filename, record count and study count of each shard.
+    Keyword arguments override the TFRecordExporterConfig defaults.
+    """
+
+    __manifest = "manifest.csv"
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**{**TFRecordExporterConfig().as_dict(), **kwargs})
+        self.manifest = None
+
+    @property
+    def manifest_filepath(self) -> str:
+        return os.path.join(self.target, TFRecordExporter.__manifest)
+
+    def execute(self, data: Any = None, context: dict = None) -> pd.DataFrame:
+        self.setup()
+
+        if os.path.exists(self.manifest_filepath) and not self.force:
+            self.manifest = IOFactory.create("csv").read(self.manifest_filepath)
+            self._skipped = True
+            logger.info("TFRecords exist in {}. Skipping export.".format(self.target))
+            self.teardown()
+            return self.manifest
+
+        for filepath in glob(os.path.join(self.target, "slices-*.tfrecord")):
+            os.remove(filepath)
+        os.makedirs(self.target, exist_ok=True)
+
+        labels = IOFactory.create("csv").read(self.labels_filepath, cache=True)
+        labels = labels.set_index(labels["StudyInstanceUID"].astype(str))[TARGETS]
+        vertebrae = self._read_vertebrae()
+
+        io = IOFactory.create("vol")
+        options = tf.io.TFRecordOptions(compression_type=self.compression or "")
+        shards, writer, n_records, studies = [], None, 0, set()
+        for filepath in sorted(glob(os.path.join(self.source, "*.vol"))):
+            study_id = os.path.basename(filepath)[: -len(".vol")]
+            if study_id not in labels.index:
+                continue
+            volume = io.read(filepath)
+            slice_numbers = np.asarray(io.read(filepath, metadata=True)["instance_numbers"])
+            presence = self._get_presence(vertebrae, study_id, slice_numbers)
+            targets = labels.loc[study_id].values
+
+            for i in range(volume.shape[0]):
+                if writer is None:
+                    shard = "slices-{:05d}.tfrecord".format(len(shards))
+                    writer = tf.io.TFRecordWriter(os.path.join(self.target, shard), options)
+                writer.write(
+                    serialize_slice(volume[i], study_id, slice_numbers[i], presence[i], targets)
+                )
+                n_records += 1
+                studies.add(study_id)
+                if n_records == self.shard_size:
+                    writer.close()
+                    shards.append((shard, n_records, len(studies)))
+                    writer, n_records, studies = None, 0, set()
+
+        if writer is not None:
+            writer.close()
+            shards.append((shard, n_records, len(studies)))
+
+        self.manifest = pd.DataFrame(shards, columns=["filename", "n_records", "n_studies"])
+        IOFactory.create("csv").write(self.manifest_filepath, self.manifest)
+        logger.info(
+            "Exported {} slices to {} shards in {}.".format(
+                self.manifest["n_records"].sum(), len(self.manifest), self.target
+            )
+        )
+        self.teardown()
+        return self.manifest
+
+    def _read_vertebrae(self) -> pd.DataFrame:
+        """Returns per-slice C1-C7 presence indexed by (StudyInstanceUID, SliceNumber)."""
+        if not os.path.exists(self.segmentation_filepath):
+            logger.warning("Segmentation metadata {} not found.".format(self.segmentation_filepath))
+            return pd.DataFrame(columns=VERTEBRAE)
+        df = IOFactory.create("csv").read(self.segmentation_filepath, cache=True)
+        df["StudyInstanceUID"] = df["StudyInstanceUID"].astype(str)
+        return df.set_index(["StudyInstanceUID", "SliceNumber"])[VERTEBRAE]
+
+    def _get_presence(
+        self, vertebrae: pd.DataFrame, study_id: str, slice_numbers: np.ndarray
+    ) -> np.ndarray:
+        index = pd.MultiIndex.from_arrays([[study_id] * len(slice_numbers), slice_numbers])
+        return vertebrae.reindex(index).fillna(-1).values.astype(np.int64)
+
+    def return_code(self) -> Union[bool, str]:
+        return self.ended is not None
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SliceLabelBuilder(Operator):
+    """Builds the per-slice label table and writes it to target as Parquet.
+
+    Joins the segmentation metadata, the study targets in train.csv and the fracture bounding
+    boxes with build_slice_labels. The existing table is returned unless force is True. Keyword
+    arguments override the SliceLabelBuilderConfig defaults.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**{**SliceLabelBuilderConfig().as_dict(), **kwargs})
+
+    def execute(self, data: Any = None, context: dict = None) -> pd.DataFrame:
+        self.setup()
+        io = IOFactory.create("parquet")
+        if os.path.exists(self.target) and not self.force:
+            self._skipped = True
+            labels = io.read(self.target)
+        else:
+            csv = IOFactory.create("csv")
+            boxes = None
+            if self.boxes_filepath and os.path.exists(self.boxes_filepath):
+                boxes = csv.read(self.boxes_filepath, cache=True)
+            labels = build_slice_labels(
+                segmentation=csv.read(self.segmentation_filepath, cache=True),
+                targets=csv.read(self.labels_filepath, cache=True),
+                boxes=boxes,
+            )
+            io.write(self.target, labels)
+        self.teardown()
+        return labels
+
+    def return_code(self) -> Union[bool, str]:
+        return self.ended is not None
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SliceAlignmentBuilder(Operator):
+    """Builds the index mapping segmentation NIfTI slices to DICOM slices.
+
+    For each NIfTI file matching source, the affine is read from the header and the
+    InstanceNumber and ImagePositionPatient of the study's DICOM slices are read without pixel
+    data. The slices are matched with align_slices in a pool of n_jobs processes and the table is
+    written to target as Parquet with StudyInstanceUID, nifti_slice, instance_number and distance
+    columns, to be loaded by AlignmentIndex. An existing target is returned unless force is True.
+    Keyword arguments override the SliceAlignmentBuilderConfig defaults.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**{**SliceAlignmentBuilderConfig().as_dict(), **kwargs})
+
+    def execute(self, data: Any = None, context: dict = None) -> pd.DataFrame:
+        self.setup()
+        if os.path.exists(self.target) and not self.force:
+            self._skipped = True
+            alignment = IOFactory.create("parquet").read(self.target)
+        else:
+            filepaths = sorted(glob(self.source))
+            if not filepaths:
+                msg = "No segmentations match {}.".format(self.source)
+                logger.error(msg)
+                raise ValueError(msg)
+            tables = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+                delayed(_align)(filepath, self.dicom_directory, self.n_threads)
+                for filepath in filepaths
+            )
+            alignment = pd.concat(tables, ignore_index=True)
+            alignment["StudyInstanceUID"] = alignment["StudyInstanceUID"].astype("category")
+            IOFactory.create("parquet").write(self.target, alignment)
+            logger.info(
+                "Aligned {} slices of {} segmentations.".format(len(alignment), len(filepaths))
+            )
+        self.teardown()
+        return alignment
+
+    def return_code(self) -> Union[bool, str]:
+        return self.ended is not None
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _preprocess(
+    source: str, filepath: str, study_id: str, window: tuple, output_shape: tuple, n_threads: int
+) -> int:
+    """Preprocesses one study and returns the number of DICOM bytes read."""
+    loader = StudyLoader(directory=source, n_workers=n_threads)
+    study = loader.load(study_id)
+    result = preprocess_study(
+        study.pixels, study.slopes, study.intercepts, window=window, output_shape=output_shape
+    )
+    top, bottom, left, right = result.box
+    spacing = (
+        study.spacing[0],
+        study.spacing[1] * (bottom - top) / output_shape[0],
+        study.spacing[2] * (right - left) / output_shape[1],
+    )
+    IOFactory.create("vol").write(
+        filepath,
+        result.volume,
+        metadata={
+            "study_id": study_id,
+            "spacing": spacing,
+            "box": result.box,
+            "window": window,
+            "instance_numbers": study.instance_numbers,
+        },
+    )
+    return sum(os.path.getsize(f) for f in study.filepaths)
+
+
+def _extract_vertebrae(
+    filepath: str, slice_numbers: np.ndarray = None, slab_size: int = 64
+) -> pd.DataFrame:
+    """Returns the per-slice presence of C1-C7 in a segmentation volume.
+
+    Labels 1-7 are C1-C7; all other labels are folded into one ignored bin. Within each slab,
+    slice i's labels are offset by i * 9 so a single bincount yields every slice's histogram.
+    slice_numbers gives the DICOM InstanceNumber of each NIfTI slice; without it, the slices are
+    assumed to be in reverse order.
+    """
+    labels = IOFactory.create("nii").read(filepath, mode="proxy")
+    n_slices = labels.shape[2]
+    n_bins = len(VERTEBRAE) + 2
+    counts = np.empty((n_slices, n_bins), dtype=np.int64)
+    for start in range(0, n_slices, slab_size):
+        stop = min(start + slab_size, n_slices)
+        slab = np.minimum(np.asanyarray(labels[:, :, start:stop]), n_bins - 1).astype(np.int16)
+        slab += (np.arange(stop - start, dtype=np.int16) * n_bins)[np.newaxis, np.newaxis, :]
+        counts[start:stop] = np.bincount(slab.ravel(), minlength=(stop - start) * n_bins).reshape(
+            stop - start, n_bins
+        )
+
+    study_id = _study_id(filepath)
+    vertebrae = pd.DataFrame(
+        (counts[:, 1 : len(VERTEBRAE) + 1] > 0).astype(np.int8), columns=VERTEBRAE  # noqa E203
+    )
+    if slice_numbers is None:
+        slice_numbers = n_slices - np.arange(n_slices)
+    elif len(slice_numbers) != n_slices:
+        raise ValueError(
+            "The alignment of {} has {} slices but the segmentation has {}.".format(
+                filepath, len(slice_numbers), n_slices
+            )
+        )
+    vertebrae.insert(0, "SliceNumber", slice_numbers)
+    vertebrae.insert(0, "StudyInstanceUID", study_id)
+    return vertebrae
+
+
+def _extract_boxes(filepath: str, slice_numbers: np.ndarray = None) -> pd.DataFrame:
+    """Returns the per-slice vertebra boxes of a segmentation volume."""
+    labels = IOFactory.create("nii").read(filepath, mode="proxy")
+    boxes = vertebra_boxes(labels, slice_numbers=slice_numbers)
+    boxes.insert(0, "StudyInstanceUID", _study_id(filepath))
+    return boxes
+
+
+def _align(filepath: str, directory: str, n_threads: int) -> pd.DataFrame:
+    """Returns the NIfTI to DICOM slice alignment of a segmentation volume."""
+    study_id = _study_id(filepath)
+    image = IOFactory.create("nii").read(filepath, mode="image")
+    instance_numbers, positions = StudyLoader(directory=directory, n_workers=n_threads).positions(
+        study_id
+    )
+    alignment = align_slices(image.affine, image.shape[2], instance_numbers, positions)
+    alignment.insert(0, "StudyInstanceUID", study_id)
+    return alignment
+
+
+def _load_alignment(filepath: str) -> Union[AlignmentIndex, None]:
+    """Returns the alignment index, or None with a warning if it has not been built."""
+    if filepath and os.path.exists(filepath):
+        return AlignmentIndex(filepath)
+    logger.warning(
+        "No slice alignment index at {}. Assuming NIfTI slices are in reverse DICOM order.".format(
+            filepath
+        )
+    )
+    return None
+
+
+def _slice_numbers(alignment: AlignmentIndex, filepath: str) -> Union[np.ndarray, None]:
+    """Returns the DICOM InstanceNumber of each slice of a segmentation, or None if unknown."""
+    if alignment is None:
+        return None
+    study_id = _study_id(filepath)
+    if study_id not in alignment:
+        logger.warning(
+            "Study {} is not in the alignment index. Assuming reverse DICOM order.".format(study_id)
+        )
+        return None
+    return alignment.get(study_id).instance_numbers
+
+
+def _study_id(filepath: str) -> str:
+    """Returns the StudyInstanceUID from a segmentation filename."""
+    filename = os.path.basename(filepath)
+    return filename[: filename.index(".nii")]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /labels.py                                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:36:53 pm                                                #
+# Modified   : Friday October 16th 2026 10:59:55 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Labels Module: Builds the per-slice label table and per-slice vertebra bounding boxes."""
+import logging
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+VERTEBRAE = ["C1", "C2", "C3", "C4", "C5", "C6", "C7"]
+KEYS = ["StudyInstanceUID", "slice_number"]
+BOX_COLUMNS = ["x", "y", "width", "height", "slice_number", "vertebra", "n_voxels"]
+# ------------------------------------------------------------------------------------------------ #
+
+
+def build_slice_labels(
+    segmentation: pd.DataFrame, targets: pd.DataFrame, boxes: pd.DataFrame = None
+) -> pd.DataFrame:
+    """Joins per-slice vertebra presence with study fracture targets and bounding boxes.
+
+    All joins are indexed merges on (StudyInstanceUID, slice_number) or StudyInstanceUID, and all
+    derived columns are computed on whole columns. Unknown values are -1 rather than 0, so they
+    are never mistaken for negatives. The result has one row per segmented slice, plus one per
+    slice with a bounding box that is not segmented:
+
+        - StudyInstanceUID (category) and slice_number (int16).
+        - C1-C7 (int8): whether the vertebra appears in the slice, or -1 if not segmented.
+        - patient_overall and C1_fracture-C7_fracture (int8): the study targets, or -1 for
+          studies missing from targets.
+        - C1_label-C7_label (int8): 1 if the vertebra appears in the slice and is fractured, 0 if
+          it is absent or not fractured, and -1 if either is unknown.
+        - x, y, width, height (float32) and has_box (int8): the union of the slice's fracture
+          bounding boxes, or NaN and 0 if it has none.
+
+    Args:
+        segmentation (pd.DataFrame): Per-slice presence with StudyInstanceUID, SliceNumber and
+            C1-C7 columns, as produced by SegmentationVertebraeExtractor.
+        targets (pd.DataFrame): train.csv with StudyInstanceUID, patient_overall and C1-C7.
+        boxes (pd.DataFrame): Optional train_bounding_boxes.csv with StudyInstanceUID, x, y,
+            width, height and slice_number.
+    """
+    labels = pd.DataFrame(
+        {
+            "StudyInstanceUID": segmentation["StudyInstanceUID"].astype(str).values,
+            "slice_number": segmentation["SliceNumber"].values.astype(np.int16),
+        }
+    )
+    labels[VERTEBRAE] = segmentation[VERTEBRAE].values.astype(np.int8)
+
+    if boxes is not None:
+        boxes = pd.DataFrame(
+            {
+                "StudyInstanceUID": boxes["StudyInstanceUID"].astype(str).values,
+                "slice_number": boxes["slice_number"].values.astype(np.int16),
+                "x": boxes["x"].values,
+                "y": boxes["y"].values,
+                "right": (boxes["x"] + boxes["width"]).values,
+                "bottom": (boxes["y"] + boxes["height"]).values,
+            }
+        )
+        boxes = boxes.groupby(KEYS, sort=False).agg(
+            x=("x", "min"), y=("y", "min"), right=("right", "max"), bottom=("bottom", "max")
+        )
+        boxes["width"] = boxes.pop("right") - boxes["x"]
+        boxes["height"] = boxes.pop("bottom") - boxes["y"]
+        labels = labels.merge(boxes.astype(np.float32).reset_index(), on=KEYS, how="outer")
+        unsegmented = labels["C1"].isna()
+        if unsegmented.any():
+            logger.warning(
+                "{} bounding box slices in {} studies have no segmentation.".format(
+                    unsegmented.sum(), labels.loc[unsegmented, "StudyInstanceUID"].nunique()
+                )
+            )
+        labels[VERTEBRAE] = labels[VERTEBRAE].fillna(-1).astype(np.int8)
+        labels["has_box"] = labels["x"].notna().astype(np.int8)
+
+    fractures = targets.set_index(targets["StudyInstanceUID"].astype(str))[
+        ["patient_overall"] + VERTEBRAE
+    ].astype(np.int8)
+    fractures.columns = ["patient_overall"] + [v + "_fracture" for v in VERTEBRAE]
+    labels = labels.join(fractures, on="StudyInstanceUID", how="left")
+    untargeted = labels["patient_overall"].isna()
+    if untargeted.any():
+        logger.warning(
+            "{} studies are missing from the targets.".format(
+                labels.loc[untargeted, "StudyInstanceUID"].nunique()
+            )
+        )
+    labels[fractures.columns] = labels[fractures.columns].fillna(-1).astype(np.int8)
+
+    presence = labels[VERTEBRAE].values
+    study_fractures = labels[[v + "_fracture" for v in VERTEBRAE]].values
+    labels[[v + "_label" for v in VERTEBRAE]] = np.where(
+        (presence == 0) | (study_fractures == 0),
+        0,
+        np.where((presence == 1) & (study_fractures == 1), 1, -1),
+    ).astype(np.int8)
+
+    columns = ["StudyInstanceUID", "slice_number"] + VERTEBRAE + list(fractures.columns)
+    columns += [v + "_label" for v in VERTEBRAE]
+    if boxes is not None:
+        columns += ["x", "y", "width", "height", "has_box"]
+    labels = labels[columns]
+    labels["StudyInstanceUID"] = labels["StudyInstanceUID"].astype("category")
+    return labels.sort_values(KEYS, ignore_index=True)
+
+
+def vertebra_boxes(
+    labels: np.ndarray, slab_size: int = 64, slice_numbers: np.ndarray = None
+) -> pd.DataFrame:
+    """Returns the 2D bounding box and voxel count of each vertebra in each slice of a mask.
+
+    The mask is read in slabs of slab_size slices. For each vertebra, the slab is projected onto
+    its two in-plane axes, and the first and last occupied row and column of every slice are found
+    with argmax over the projections, so boxes for all slices of a slab are computed at once.
+
+    Boxes follow the train_bounding_boxes.csv convention: x and width are along DICOM columns, y
+    and height along DICOM rows, in pixels, since the NIfTI (i, j) axes map to DICOM (column,
+    reversed row). slice_number is the DICOM InstanceNumber of each NIfTI slice, given by
+    slice_numbers, for example from AlignmentIndex. Without it, the NIfTI slices are assumed to run
+    in the reverse order of the DICOM slices.
+
+    Args:
+        labels (np.ndarray): Segmentation with shape (i, j, k) in NIfTI orientation and labels
+            1-7 for C1-C7. Array proxies are accepted and read one slab at a time.
+        slab_size (int): The number of slices read and projected at once.
+        slice_numbers (np.ndarray): Optional DICOM InstanceNumber of each NIfTI slice.
+
+    Returns:
+        DataFrame with columns x, y, width, height, slice_number, vertebra and n_voxels, with one
+        row per vertebra present in a slice, ordered by slice_number and vertebra.
+    """
+    n_columns, n_rows, n_slices = labels.shape
+    if slice_numbers is None:
+        slice_numbers = n_slices - np.arange(n_slices)
+    elif len(slice_numbers) != n_slices:
+        raise ValueError(
+            "Expected {} slice numbers, one per slice, but got {}.".format(
+                n_slices, len(slice_numbers)
+            )
+        )
+    boxes = []
+    for start in range(0, n_slices, slab_size):
+        stop = min(start + slab_size, n_slices)
+        slab = np.asanyarray(labels[:, :, start:stop])
+        for label, vertebra in enumerate(VERTEBRAE, 1):
+            mask = slab == label
+            columns = mask.any(axis=1)
+            rows = mask.any(axis=0)
+            present = columns.any(axis=0)
+            if not present.any():
+                continue
+            i0 = columns.argmax(axis=0)[present]
+            i1 = n_columns - columns[::-1].argmax(axis=0)[present]
+            j0 = rows.argmax(axis=0)[present]
+            j1 = n_rows - rows[::-1].argmax(axis=0)[present]
+            boxes.append(
+                pd.DataFrame(
+                    {
+                        "x": i0,
+                        "y": n_rows - j1,
+                        "width": i1 - i0,
+                        "height": j1 - j0,
+                        "slice_number": slice_numbers[start + np.flatnonzero(present)],
+                        "vertebra": vertebra,
+                        "n_voxels": np.count_nonzero(mask, axis=(0, 1))[present],
+                    }
+                )
+            )
+
+    if not boxes:
+        return pd.DataFrame(columns=BOX_COLUMNS)
+    boxes = pd.concat(boxes, ignore_index=True)
+    boxes[["x", "y", "width", "height"]] = boxes[["x", "y", "width", "height"]].astype(np.float32)
+    boxes["slice_number"] = boxes["slice_number"].astype(np.int16)
+    boxes["n_voxels"] = boxes["n_voxels"].astype(np.int32)
+    return boxes.sort_values(["slice_number", "vertebra"], ignore_index=True)
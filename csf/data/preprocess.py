@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /preprocess.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:33:21 pm                                                #
+# Modified   : Friday October 16th 2026 11:14:36 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Fused preprocessing of study volumes: Hounsfield units, windowing, cropping and resizing."""
+from time import perf_counter
+from types import SimpleNamespace
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+from csf.data.transforms import (
+    WINDOW_BONE,
+    window_bounds,
+    to_hounsfield,
+    volume_to_hounsfield,
+    windower,
+    crop,
+    resize,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class Preprocessed:
+    """Output of preprocess_study.
+
+    Args:
+        volume (np.ndarray): float32 volume with shape (slices,) + output_shape.
+        box (tuple): The (top, bottom, left, right) crop box in the source pixel coordinates.
+        timings (dict): Seconds spent in each stage.
+    """
+
+    volume: np.ndarray
+    box: tuple
+    timings: dict = field(default_factory=dict)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def study_bounding_box(
+    pixels: np.ndarray, slopes: np.ndarray, intercepts: np.ndarray, window: tuple = WINDOW_BONE
+) -> tuple:
+    """Returns the union box of pixels above the window minimum, computed from raw pixels.
+
+    Since Hounsfield units increase with the stored pixel value, a row contains pixels above the
+    window minimum exactly when its maximum stored value does. The row and column maxima are
+    converted to Hounsfield units, so the full volume is never converted to find the box.
+    """
+    img_min, _ = window_bounds(window)
+    slopes = np.asarray(slopes, dtype=np.float32).reshape(-1, 1)
+    intercepts = np.asarray(intercepts, dtype=np.float32).reshape(-1, 1)
+    extents = []
+    for axis in (2, 1):
+        projection = pixels.max(axis=axis) * slopes + intercepts
+        foreground = np.flatnonzero((projection > img_min).any(axis=0))
+        if foreground.size == 0:
+            return (0, pixels.shape[1], 0, pixels.shape[2])
+        extents.extend([int(foreground[0]), int(foreground[-1]) + 1])
+    return tuple(extents)
+
+
+def preprocess_study(
+    pixels: np.ndarray,
+    slopes: np.ndarray,
+    intercepts: np.ndarray,
+    window: tuple = WINDOW_BONE,
+    output_shape: tuple = (256, 256),
+    box: tuple = None,
+    slab_size: int = 32,
+) -> Preprocessed:
+    """Converts a study to Hounsfield units, windows, crops and resizes it with one intermediate.
+
+    The crop box is found first from raw pixel projections, or taken from ``box``. Only the
+    cropped region is converted to Hounsfield units, into a single float32 buffer which is then
+    clipped to the window in place and resized into the preallocated output. The resize runs
+    ``slab_size`` slices at a time, so the only other temporaries are the tensor copies of one
+    slab and its resized slices.
+
+    Args:
+        pixels (np.ndarray): Stored pixel values with shape (slices, rows, cols), e.g. Study.pixels.
+        slopes (np.ndarray): RescaleSlope of each slice.
+        intercepts (np.ndarray): RescaleIntercept of each slice.
+        window (tuple): The (width, center) window.
+        output_shape (tuple): The (rows, cols) of each output slice.
+        box (tuple): Optional (top, bottom, left, right) crop box, e.g. from a previous call.
+        slab_size (int): The number of slices resized at a time.
+    """
+    timings = {}
+
+    start = perf_counter()
+    box = box or study_bounding_box(pixels, slopes, intercepts, window=window)
+    top, bottom, left, right = box
+    timings["crop"] = perf_counter() - start
+
+    start = perf_counter()
+    buffer = np.empty((pixels.shape[0], bottom - top, right - left), dtype=np.float32)
+    volume_to_hounsfield(pixels[:, top:bottom, left:right], slopes, intercepts, out=buffer)
+    timings["hounsfield"] = perf_counter() - start
+
+    start = perf_counter()
+    img_min, img_max = window_bounds(window)
+    np.clip(buffer, img_min, img_max, out=buffer)
+    timings["window"] = perf_counter() - start
+
+    start = perf_counter()
+    volume = np.empty((pixels.shape[0],) + tuple(output_shape), dtype=np.float32)
+    for start_slice in range(0, pixels.shape[0], slab_size):
+        slab = slice(start_slice, start_slice + slab_size)
+        # Converting to a tensor copies the slab, so only a slab is copied at a time. The reshape
+        # drops the channel axis without the copy a strided [..., 0] slice would make.
+        resized = tf.image.resize(buffer[slab, ..., np.newaxis], size=output_shape)
+        volume[slab] = tf.reshape(resized, tf.shape(resized)[:-1]).numpy()
+    timings["resize"] = perf_counter() - start
+
+    timings["total"] = sum(timings.values())
+    return Preprocessed(volume=volume, box=box, timings=timings)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def preprocess_chained(
+    pixels: np.ndarray,
+    slopes: np.ndarray,
+    intercepts: np.ndarray,
+    window: tuple = WINDOW_BONE,
+    output_shape: tuple = (256, 256),
+) -> Preprocessed:
+    """Preprocesses a study slice by slice with the chained transform functions, for comparison.
+
+    Each slice is cropped to its own box, so unlike preprocess_study the output slices are not
+    spatially aligned.
+    """
+    timings = dict.fromkeys(["hounsfield", "window", "crop", "resize"], 0.0)
+    img_min, _ = window_bounds(window)
+    slices = []
+    for i in range(pixels.shape[0]):
+        dicom = SimpleNamespace(
+            pixel_array=pixels[i],
+            RescaleSlope=np.float64(slopes[i]),
+            RescaleIntercept=np.float64(intercepts[i]),
+        )
+        start = perf_counter()
+        image = to_hounsfield(dicom)
+        timings["hounsfield"] += perf_counter() - start
+
+        start = perf_counter()
+        image = windower(image, window=window)
+        timings["window"] += perf_counter() - start
+
+        start = perf_counter()
+        image = crop(image, background=img_min)
+        timings["crop"] += perf_counter() - start
+
+        start = perf_counter()
+        slices.append(resize(image[..., np.newaxis], output_shape=output_shape)[..., 0].numpy())
+        timings["resize"] += perf_counter() - start
+
+    timings["total"] = sum(timings.values())
+    return Preprocessed(volume=np.stack(slices), box=None, timings=timings)
+
+
+def benchmark(
+    pixels: np.ndarray,
+    slopes: np.ndarray,
+    intercepts: np.ndarray,
+    window: tuple = WINDOW_BONE,
+    output_shape: tuple = (256, 256),
+    repeats: int = 3,
+) -> pd.DataFrame:
+    """Compares the per-stage timings of preprocess_study and the chained transforms.
+
+    Returns a DataFrame indexed by stage with the best time in seconds of each method over
+    ``repeats`` runs and the speedup of the fused method.
+    """
+    results = {}
+    for name, fn in (("chained", preprocess_chained), ("fused", preprocess_study)):
+        runs = [
+            fn(pixels, slopes, intercepts, window=window, output_shape=output_shape).timings
+            for _ in range(repeats)
+        ]
+        results[name] = pd.DataFrame(runs).min(axis=0)
+    df = pd.DataFrame(results)
+    df["speedup"] = df["chained"] / df["fused"]
+    return df
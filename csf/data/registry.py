@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /registry.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:27:12 pm                                                #
+# Modified   : Friday October 16th 2026 11:13:15 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""File Registry Module"""
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import List, Union
+from pydicom.errors import InvalidDicomError
+
+from csf.base.io import IOFactory
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+REGISTRY_FILEPATH = "config/file_registry.csv"
+MANIFEST_FILEPATH = "data/manifest/dicom_manifest.parquet"
+# ------------------------------------------------------------------------------------------------ #
+
+
+class FileRegistry:
+    """Registry of named data files and a manifest of the DICOM slices of each study.
+
+    The registry maps names such as 'train' or 'train_images' to paths relative to ``base_dir``.
+    The manifest has one row per slice, with the study, the slice filepath, the slice number
+    parsed from the filename, or the InstanceNumber if the filename is not a number, and the file
+    size. Files with neither are skipped with a warning. The manifest is written atomically as
+    Parquet and refreshed incrementally: only study directories that are new or whose modification
+    time has changed are rescanned, and removed studies are dropped. Lookups by study are O(1).
+
+    Args:
+        filepath (str): The registry CSV file with name, path and description columns.
+        manifest_filepath (str): Where the manifest is persisted.
+        base_dir (str): Directory to which the registry paths are relative.
+        n_workers (int): The number of threads used to scan study directories.
+    """
+
+    def __init__(
+        self,
+        filepath: str = REGISTRY_FILEPATH,
+        manifest_filepath: str = MANIFEST_FILEPATH,
+        base_dir: str = "data",
+        n_workers: int = 12,
+    ) -> None:
+        self._registry = IOFactory.create("csv").read(filepath, index_col="name")
+        self._manifest_filepath = manifest_filepath
+        self._base_dir = base_dir
+        self._n_workers = n_workers
+        self._manifest = None
+        self._index = {}
+        self._filepaths = None
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._registry.index)
+
+    def path(self, name: str) -> str:
+        """Returns the path of a registered file or directory."""
+        try:
+            return os.path.join(self._base_dir, self._registry.loc[name, "path"])
+        except KeyError as e:
+            raise ValueError("No file named {} in the registry.\n{}".format(name, e))
+
+    @property
+    def manifest(self) -> pd.DataFrame:
+        if self._manifest is None:
+            self._load()
+        return self._manifest
+
+    @property
+    def studies(self) -> List[str]:
+        if self._manifest is None:
+            self._load()
+        return list(self._index.keys())
+
+    def slices(self, study_id: str) -> List[str]:
+        """Returns the slice filepaths of a study ordered by slice number."""
+        start, stop = self._lookup(study_id)
+        return self._filepaths[start:stop].tolist()
+
+    def slice_count(self, study_id: str) -> int:
+        start, stop = self._lookup(study_id)
+        return stop - start
+
+    def nbytes(self, study_id: str) -> int:
+        """Returns the total size of a study's slice files in bytes."""
+        start, stop = self._lookup(study_id)
+        return int(self._manifest["size"].values[start:stop].sum())
+
+    def refresh(self, name: str = "train_images", force: bool = False) -> pd.DataFrame:
+        """Updates the manifest from the registered directory and persists it.
+
+        Args:
+            name (str): Registered directory containing one subdirectory per study.
+            force (bool): Rescan every study directory rather than only new or changed ones.
+        """
+        directory = self.path(name)
+        manifest = self._read_manifest()
+
+        current = {
+            entry.name: entry.stat().st_mtime_ns
+            for entry in os.scandir(directory)
+            if entry.is_dir()
+        }
+        known = {}
+        if not force and len(manifest) > 0:
+            known = manifest.groupby("StudyInstanceUID", observed=True)["study_mtime_ns"].first()
+            known = known.to_dict()
+        changed = [study for study, mtime in current.items() if known.get(study) != mtime]
+        unchanged = set(current.keys()) - set(changed)
+
+        with ThreadPoolExecutor(max_workers=self._n_workers) as executor:
+            scanned = list(
+                executor.map(lambda study: self._scan(directory, study, current[study]), changed)
+            )
+        logger.info(
+            "Rescanned {} of {} studies in {}.".format(len(changed), len(current), directory)
+        )
+
+        manifest = pd.concat(
+            [manifest[manifest["StudyInstanceUID"].isin(unchanged)]] + scanned,
+            ignore_index=True,
+        )
+        manifest["StudyInstanceUID"] = manifest["StudyInstanceUID"].astype(str)
+        manifest = manifest.sort_values(["StudyInstanceUID", "slice_number"], ignore_index=True)
+
+        os.makedirs(os.path.dirname(self._manifest_filepath) or ".", exist_ok=True)
+        IOFactory.create("parquet").write(self._manifest_filepath, manifest)
+        self._set_manifest(manifest)
+        return self._manifest
+
+    def _scan(self, directory: str, study: str, mtime_ns: int) -> pd.DataFrame:
+        entries, slice_numbers = [], []
+        for entry in os.scandir(os.path.join(directory, study)):
+            if entry.name.endswith(".dcm"):
+                slice_number = self._get_slice_number(entry)
+                if slice_number is not None:
+                    entries.append(entry)
+                    slice_numbers.append(slice_number)
+        return pd.DataFrame(
+            {
+                "StudyInstanceUID": study,
+                "filepath": [entry.path for entry in entries],
+                "slice_number": np.array(slice_numbers, dtype=np.int32),
+                "size": np.array([entry.stat().st_size for entry in entries], dtype=np.int64),
+                "study_mtime_ns": np.int64(mtime_ns),
+            }
+        )
+
+    def _get_slice_number(self, entry: os.DirEntry) -> Union[int, None]:
+        """Returns the slice number from the filename, else the InstanceNumber, else None."""
+        try:
+            return int(os.path.splitext(entry.name)[0])
+        except ValueError:
+            pass
+        try:
+            instance_number = IOFactory.create("dcm").read(
+                entry.path, mode="tags", tags=["InstanceNumber"]
+            )["InstanceNumber"]
+        except (OSError, InvalidDicomError) as e:
+            instance_number = None
+            logger.warning("Unable to read {}\n{}".format(entry.path, e))
+        if instance_number is None:
+            logger.warning("Skipping {} which has no slice number.".format(entry.path))
+        return instance_number
+
+    def _read_manifest(self) -> pd.DataFrame:
+        if os.path.exists(self._manifest_filepath):
+            return IOFactory.create("parquet").read(self._manifest_filepath)
+        return pd.DataFrame(
+            columns=["StudyInstanceUID", "filepath", "slice_number", "size", "study_mtime_ns"]
+        )
+
+    def _load(self) -> None:
+        if not os.path.exists(self._manifest_filepath):
+            raise FileNotFoundError(
+                "Manifest {} not found. Call refresh() to build it.".format(self._manifest_filepath)
+            )
+        self._set_manifest(self._read_manifest())
+
+    def _set_manifest(self, manifest: pd.DataFrame) -> None:
+        self._manifest = manifest
+        self._filepaths = manifest["filepath"].to_numpy()
+        self._index = {
+            study: (int(idx[0]), int(idx[-1]) + 1)
+            for study, idx in manifest.groupby("StudyInstanceUID", sort=False).indices.items()
+        }
+
+    def _lookup(self, study_id: str) -> tuple:
+        if self._manifest is None:
+            self._load()
+        try:
+            return self._index[study_id]
+        except KeyError as e:
+            raise ValueError("Study {} is not in the manifest.\n{}".format(study_id, e))
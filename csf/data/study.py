@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /study.py                                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:21:51 pm                                                #
+# Modified   : Friday October 16th 2026 11:00:58 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""Study Module: Loads the DICOM slices of a CT study into a single volume."""
+import os
+from glob import glob
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+from typing import List, Tuple
+
+from csf.base.io import DicomImage, IOFactory
+
+# ------------------------------------------------------------------------------------------------ #
+RAW_SCANS_DIR = "data/raw/train_images"
+HEADER_TAGS = [
+    "Rows",
+    "Columns",
+    "InstanceNumber",
+    "ImagePositionPatient",
+    "PixelSpacing",
+    "SliceThickness",
+]
+# ------------------------------------------------------------------------------------------------ #
+
+
+@dataclass
+class Study:
+    """CT study volume and its spatial metadata.
+
+    Args:
+        study_id (str): The StudyInstanceUID.
+        pixels (np.ndarray): Contiguous int16 array of stored pixel values, shape (slices, rows, cols).
+        filepaths (list): The slice filepaths in volume order.
+        instance_numbers (np.ndarray): The InstanceNumber of each slice in volume order.
+        positions (np.ndarray): The ImagePositionPatient of each slice, shape (slices, 3).
+        slopes (np.ndarray): The RescaleSlope of each slice.
+        intercepts (np.ndarray): The RescaleIntercept of each slice.
+        spacing (tuple): The voxel spacing in mm as (slice, row, column).
+    """
+
+    study_id: str
+    pixels: np.ndarray
+    filepaths: List[str]
+    instance_numbers: np.ndarray
+    positions: np.ndarray
+    slopes: np.ndarray
+    intercepts: np.ndarray
+    spacing: tuple
+
+    @property
+    def shape(self) -> tuple:
+        return self.pixels.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.pixels.nbytes
+
+
+# ------------------------------------------------------------------------------------------------ #
+class StudyLoader:
+    """Loads all slices of a study concurrently into one preallocated int16 volume.
+
+    Each file is read once. The first slice determines the volume shape, and the remaining slices
+    are decoded by a thread pool and written directly into a preallocated volume in file order,
+    together with the header tags that determine the slice order. The volume is then put in slice
+    order with a single gather, which is skipped when the files were already in order.
+
+    Args:
+        directory (str): Directory containing one subdirectory of DICOM files per study.
+        n_workers (int): The number of threads used to read slices.
+        sort_by (str): Either 'InstanceNumber' or 'ImagePositionPatient'.
+    """
+
+    __sort_keys = ("InstanceNumber", "ImagePositionPatient")
+
+    def __init__(
+        self, directory: str = RAW_SCANS_DIR, n_workers: int = 12, sort_by: str = "InstanceNumber"
+    ) -> None:
+        if sort_by not in StudyLoader.__sort_keys:
+            raise ValueError(
+                "Invalid sort_by {}. Valid values are {}.".format(sort_by, StudyLoader.__sort_keys)
+            )
+        self._directory = directory
+        self._n_workers = n_workers
+        self._sort_by = sort_by
+        self._io = IOFactory.create("dcm")
+
+    def filepaths(self, study_id: str) -> List[str]:
+        """Returns the DICOM filepaths for a study, in no particular order."""
+        filepaths = glob(os.path.join(self._directory, study_id, "*.dcm"))
+        if len(filepaths) == 0:
+            raise FileNotFoundError(
+                "No DICOM files found for study {} in {}.".format(study_id, self._directory)
+            )
+        return filepaths
+
+    def load(self, study_id: str, filepaths: List[str] = None) -> Study:
+        """Loads a study.
+
+        Args:
+            study_id (str): The StudyInstanceUID.
+            filepaths (list): Optional slice filepaths. If None, the study directory is globbed.
+        """
+        filepaths = filepaths or self.filepaths(study_id)
+
+        # The first slice sizes the volume; the rest are decoded concurrently into their slots.
+        first = self._io.read(filepaths[0], mode="pixels")
+        pixels = np.empty((len(filepaths),) + first.pixels.shape, dtype=first.pixels.dtype)
+        slopes = np.empty(len(filepaths), dtype=np.float32)
+        intercepts = np.empty(len(filepaths), dtype=np.float32)
+        headers = [None] * len(filepaths)
+
+        def read_slice(i: int, image: DicomImage = None) -> None:
+            image = image or self._io.read(filepaths[i], mode="pixels")
+            pixels[i] = image.pixels
+            slopes[i] = image.slope
+            intercepts[i] = image.intercept
+            headers[i] = {tag: image.header.get(tag) for tag in HEADER_TAGS}
+
+        read_slice(0, first)
+        with ThreadPoolExecutor(max_workers=self._n_workers) as executor:
+            # Consume the iterator so exceptions raised in the workers propagate here.
+            list(executor.map(read_slice, range(1, len(filepaths))))
+
+        instance_numbers, positions = self._get_positions(headers)
+        if self._sort_by == "InstanceNumber":
+            order = np.argsort(instance_numbers, kind="stable")
+        else:
+            order = np.argsort(positions[:, 2], kind="stable")
+        if np.any(order != np.arange(len(order))):
+            pixels, slopes, intercepts = pixels[order], slopes[order], intercepts[order]
+
+        return Study(
+            study_id=study_id,
+            pixels=pixels,
+            filepaths=[filepaths[i] for i in order],
+            instance_numbers=instance_numbers[order],
+            positions=positions[order],
+            slopes=slopes,
+            intercepts=intercepts,
+            spacing=self._get_spacing(headers[0], positions[order]),
+        )
+
+    def positions(
+        self, study_id: str, filepaths: List[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the InstanceNumber and ImagePositionPatient of each slice, without pixel data.
+
+        Slices are ordered by InstanceNumber.
+
+        Args:
+            study_id (str): The StudyInstanceUID.
+            filepaths (list): Optional slice filepaths. If None, the study directory is globbed.
+        """
+        filepaths = filepaths or self.filepaths(study_id)
+        with ThreadPoolExecutor(max_workers=self._n_workers) as executor:
+            headers = list(executor.map(self._read_header, filepaths))
+        instance_numbers, positions = self._get_positions(headers)
+        order = np.argsort(instance_numbers, kind="stable")
+        return instance_numbers[order], positions[order]
+
+    def _read_header(self, filepath: str) -> dict:
+        return self._io.read(filepath, mode="tags", tags=HEADER_TAGS)
+
+    def _get_positions(self, headers: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the InstanceNumber and ImagePositionPatient of each header, in header order."""
+        instance_numbers = np.array([h["InstanceNumber"] or 0 for h in headers], dtype=np.int32)
+        positions = np.array(
+            [h["ImagePositionPatient"] or [0.0, 0.0, 0.0] for h in headers], dtype=np.float32
+        )
+        return instance_numbers, positions
+
+    def _get_spacing(self, header: dict, positions: np.ndarray) -> tuple:
+        """Returns (slice, row, column) spacing, preferring the distance between slice positions."""
+        row_spacing, col_spacing = header["PixelSpacing"] or [1.0, 1.0]
+        if len(positions) > 1:
+            slice_spacing = float(np.median(np.abs(np.diff(positions[:, 2]))))
+        else:
+            slice_spacing = 0.0
+        if slice_spacing == 0.0:
+            slice_spacing = float(header["SliceThickness"] or 1.0)
+        return (slice_spacing, float(row_spacing), float(col_spacing))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /tfrecord.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:35:51 pm                                                #
+# Modified   : Friday October 16th 2026 10:35:51 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+"""TFRecord Module: Serialization of labelled slices."""
+import numpy as np
+import tensorflow as tf
+
+# ------------------------------------------------------------------------------------------------ #
+VERTEBRAE = ["C1", "C2", "C3", "C4", "C5", "C6", "C7"]
+TARGETS = ["patient_overall"] + VERTEBRAE
+FEATURES = {
+    "image": tf.io.FixedLenFeature([], tf.string),
+    "height": tf.io.FixedLenFeature([], tf.int64),
+    "width": tf.io.FixedLenFeature([], tf.int64),
+    "study_id": tf.io.FixedLenFeature([], tf.string),
+    "slice_number": tf.io.FixedLenFeature([], tf.int64),
+    "vertebrae": tf.io.FixedLenFeature([len(VERTEBRAE)], tf.int64),
+    "targets": tf.io.FixedLenFeature([len(TARGETS)], tf.int64),
+}
+# ------------------------------------------------------------------------------------------------ #
+
+
+def _bytes_feature(value: bytes) -> tf.train.Feature:
+    return tf.train.Feature(bytes_list=tf.train.BytesList(value=[value]))
+
+
+def _int64_feature(values: list) -> tf.train.Feature:
+    return tf.train.Feature(int64_list=tf.train.Int64List(value=values))
+
+
+def serialize_slice(
+    image: np.ndarray,
+    study_id: str,
+    slice_number: int,
+    vertebrae: np.ndarray,
+    targets: np.ndarray,
+) -> bytes:
+    """Returns a serialized tf.train.Example for one slice.
+
+    Args:
+        image (np.ndarray): The preprocessed slice, stored as raw float16 bytes.
+        study_id (str): The StudyInstanceUID.
+        slice_number (int): The slice's InstanceNumber.
+        vertebrae (np.ndarray): Presence of C1-C7 in the slice, or -1 where unknown.
+        targets (np.ndarray): The study's patient_overall and C1-C7 fracture targets.
+    """
+    feature = {
+        "image": _bytes_feature(np.ascontiguousarray(image, dtype=np.float16).tobytes()),
+        "height": _int64_feature([image.shape[0]]),
+        "width": _int64_feature([image.shape[1]]),
+        "study_id": _bytes_feature(study_id.encode()),
+        "slice_number": _int64_feature([int(slice_number)]),
+        "vertebrae": _int64_feature([int(v) for v in vertebrae]),
+        "targets": _int64_feature([int(t) for t in targets]),
+    }
+    return tf.train.Example(features=tf.train.Features(feature=feature)).SerializeToString()
+
+
+def parse_example(serialized: tf.Tensor) -> dict:
+    """Parses a serialized slice into a dictionary of tensors with a float32 (h, w, 1) image."""
+    example = tf.io.parse_single_example(serialized, FEATURES)
+    image = tf.io.decode_raw(example["image"], tf.float16)
+    shape = tf.stack([example["height"], example["width"], 1])
+    example["image"] = tf.cast(tf.reshape(image, shape), tf.float32)
+    return example
@@ -11,17 +11,23 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday October 18th 2022 03:32:14 am                                               #
-# Modified   : Sunday October 23rd 2022 11:11:09 am                                                #
+# Modified   : Friday October 16th 2026 11:11:19 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 import pydicom
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import tensorflow as tf
 from tensorflow.keras import layers
 
-from csf import WINDOW_DEFAULT
+# ------------------------------------------------------------------------------------------------ #
+# Windows are (width, center) in Hounsfield units.
+WINDOW_BONE = (1800, 400)
+WINDOW_SOFT_TISSUE = (400, 40)
+WINDOW_BRAIN = (80, 40)
+WINDOWS_DEFAULT = (WINDOW_BONE, WINDOW_SOFT_TISSUE, WINDOW_BRAIN)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -42,20 +48,77 @@ def to_hounsfield(dicom: pydicom.FileDataset):
     return image
 
 
+def volume_to_hounsfield(
+    pixels: np.ndarray,
+    slopes: np.ndarray,
+    intercepts: np.ndarray,
+    out: np.ndarray = None,
+    dtype: np.dtype = np.int16,
+    chunk_size: int = 32,
+) -> np.ndarray:
+    """Converts a stacked study to Hounsfield units using per-slice slopes and intercepts.
+
+    When every slope is one and every intercept is integral, as is typical for CT, the conversion
+    is a single integer addition into the output. Otherwise slices are converted in chunks of
+    ``chunk_size`` through a float32 scratch buffer, so no full-volume temporaries are allocated.
+
+    Args:
+        pixels (np.ndarray): Stored pixel values with shape (slices, rows, cols).
+        slopes (np.ndarray): RescaleSlope of each slice.
+        intercepts (np.ndarray): RescaleIntercept of each slice.
+        out (np.ndarray): Optional output buffer with the same shape as pixels. Its dtype
+            overrides ``dtype``. May be ``pixels`` itself for an in-place conversion.
+        dtype (np.dtype): The output dtype, int16 or float32, used if out is None.
+        chunk_size (int): The number of slices converted per chunk on the float path.
+    """
+    n = pixels.shape[0]
+    slopes = np.broadcast_to(np.asarray(slopes, dtype=np.float32), (n,)).reshape(n, 1, 1)
+    intercepts = np.broadcast_to(np.asarray(intercepts, dtype=np.float32), (n,)).reshape(n, 1, 1)
+    if out is None:
+        out = np.empty(pixels.shape, dtype=dtype)
+    integer_output = np.issubdtype(out.dtype, np.integer)
+
+    if np.all(slopes == 1) and np.all(intercepts == np.round(intercepts)):
+        np.add(pixels, intercepts.astype(out.dtype), out=out, casting="unsafe")
+        return out
+
+    if not integer_output:
+        np.multiply(pixels, slopes, out=out, casting="unsafe")
+        np.add(out, intercepts, out=out, casting="unsafe")
+        return out
+
+    scratch = np.empty((min(chunk_size, n),) + pixels.shape[1:], dtype=np.float32)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        buffer = scratch[: stop - start]
+        np.multiply(pixels[start:stop], slopes[start:stop], out=buffer, casting="unsafe")
+        np.add(buffer, intercepts[start:stop], out=buffer)
+        np.rint(buffer, out=buffer)
+        np.copyto(out[start:stop], buffer, casting="unsafe")
+    return out
+
+
 # ------------------------------------------------------------------------------------------------ #
 class Hounsfield(layers.Layer):
-    """Linear transformation to Hounsfield Units"""
+    """Linear transformation to Hounsfield Units
+
+    Operates on tensors only, so it can run inside tf.function and tf.data map calls.
+    """
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-    def call(self, dicom: pydicom.FileDataset) -> np.array:
-        """Takes a DICOM FileDataset and returns a transformed image
+    def call(self, inputs: tuple) -> tf.Tensor:
+        """Takes stored pixel values with their rescale slope and intercept and returns float32 HU.
 
         Args:
-            dicom (pydicom.FileDataset): DICOM FileDataset containing the image to transform
+            inputs (tuple): (pixels, slope, intercept) tensors. Slope and intercept are scalars
+                or broadcast against pixels, e.g. shape (slices, 1, 1) for a volume.
         """
-        return to_hounsfield(dicom)
+        pixels, slope, intercept = inputs
+        return tf.cast(pixels, tf.float32) * tf.cast(slope, tf.float32) + tf.cast(
+            intercept, tf.float32
+        )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -63,7 +126,13 @@ class Hounsfield(layers.Layer):
 # ------------------------------------------------------------------------------------------------ #
 
 
-def windower(image: np.array, window: tuple = WINDOW_DEFAULT) -> np.array:
+def window_bounds(window: tuple) -> tuple:
+    """Returns the (min, max) Hounsfield units of a (width, center) window."""
+    window_width, window_center = window
+    return window_center - window_width // 2, window_center + window_width // 2
+
+
+def windower(image: np.array, window: tuple = WINDOW_BONE) -> np.array:
     window_width = window[0]
     window_center = window[1]
 
@@ -78,36 +147,195 @@ def windower(image: np.array, window: tuple = WINDOW_DEFAULT) -> np.array:
 
 # ------------------------------------------------------------------------------------------------ #
 class Windower(layers.Layer):
-    def __init__(self, window: tuple = WINDOW_DEFAULT, **kwargs) -> None:
+    """Clips a Hounsfield unit tensor to a (width, center) window. The input is not modified."""
+
+    def __init__(self, window: tuple = WINDOW_BONE, **kwargs) -> None:
         super().__init__(**kwargs)
         self._window = window
 
-    def call(self, image: np.array) -> np.array:
-        return windower(image=image, window=self._window)
+    def call(self, image: tf.Tensor) -> tf.Tensor:
+        img_min, img_max = window_bounds(self._window)
+        return tf.clip_by_value(tf.cast(image, tf.float32), img_min, img_max)
+
+    def get_config(self) -> dict:
+        config = super().get_config()
+        config.update({"window": self._window})
+        return config
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     MULTI-WINDOWER                                               #
+# ------------------------------------------------------------------------------------------------ #
+
+
+def multi_windower(
+    image: np.ndarray,
+    windows: tuple = WINDOWS_DEFAULT,
+    dtype: np.dtype = np.uint8,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """Stacks several windows of a Hounsfield unit image into channels.
+
+    Each window is clipped and normalized through one float32 scratch buffer using ufuncs with
+    ``out=``, and written into its channel of the output. The input is not modified. uint8 outputs
+    are scaled to [0, 255] and floating point outputs to [0, 1].
+
+    Args:
+        image (np.ndarray): Image or volume in Hounsfield units.
+        windows (tuple): Sequence of (width, center) windows, one per output channel.
+        dtype (np.dtype): The output dtype, e.g. uint8 or float16, used if out is None.
+        out (np.ndarray): Optional output buffer with shape image.shape + (len(windows),).
+
+    Returns an array with shape image.shape + (len(windows),).
+    """
+    if out is None:
+        out = np.empty(image.shape + (len(windows),), dtype=dtype)
+    max_value = 255.0 if np.issubdtype(out.dtype, np.integer) else 1.0
+    scratch = np.empty(image.shape, dtype=np.float32)
+
+    for i, window in enumerate(windows):
+        img_min, img_max = window_bounds(window)
+        np.clip(image, img_min, img_max, out=scratch, casting="unsafe")
+        np.subtract(scratch, img_min, out=scratch)
+        np.multiply(scratch, max_value / (img_max - img_min), out=scratch)
+        if max_value > 1:
+            np.rint(scratch, out=scratch)
+        np.copyto(out[..., i], scratch, casting="unsafe")
+    return out
+
+
+# ------------------------------------------------------------------------------------------------ #
+class MultiWindower(layers.Layer):
+    """Stacks several windows of a Hounsfield unit tensor into the channel dimension.
+
+    Args:
+        windows (tuple): Sequence of (width, center) windows, one per output channel.
+        output_dtype (str): 'uint8' scales channels to [0, 255], float dtypes scale to [0, 1].
+    """
+
+    def __init__(
+        self, windows: tuple = WINDOWS_DEFAULT, output_dtype: str = "uint8", **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self._windows = windows
+        self._output_dtype = tf.as_dtype(output_dtype)
+
+    def call(self, image: tf.Tensor) -> tf.Tensor:
+        image = tf.cast(image, tf.float32)
+        max_value = 255.0 if self._output_dtype.is_integer else 1.0
+        channels = []
+        for window in self._windows:
+            img_min, img_max = window_bounds(window)
+            channel = tf.clip_by_value(image, img_min, img_max)
+            channel = (channel - img_min) * (max_value / (img_max - img_min))
+            if self._output_dtype.is_integer:
+                channel = tf.round(channel)
+            channels.append(channel)
+        return tf.cast(tf.stack(channels, axis=-1), self._output_dtype)
+
+    def get_config(self) -> dict:
+        config = super().get_config()
+        config.update({"windows": self._windows, "output_dtype": self._output_dtype.name})
+        return config
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                           CROP                                                   #
 # ------------------------------------------------------------------------------------------------ #
-def crop(image: np.array) -> np.array:
-    mask = image == 0
+def bounding_box(image: np.ndarray, background: float = 0) -> tuple:
+    """Returns the (top, bottom, left, right) extent of the non-background pixels.
 
-    # Find the cervical spine area
-    coords = np.array(np.nonzero(~mask))
-    top_left = np.min(coords, axis=1)
-    bottom_right = np.max(coords, axis=1)
+    The extent is found from row and column projections: the maximum and minimum over every axis
+    but the row (or column) axis differ from background wherever a row (or column) contains
+    foreground. No image-sized mask or coordinate arrays are allocated. For a volume with shape
+    (slices, rows, cols) the result is the union box over all slices. Bottom and right are
+    exclusive. If the image is all background, the full extent is returned.
 
-    image = image[top_left[0] : bottom_right[0], top_left[1] : bottom_right[1]]  # noqa E203
+    Args:
+        image (np.ndarray): Image (rows, cols) or volume (slices, rows, cols).
+        background (float): The background value.
+    """
+    row_axis, col_axis = image.ndim - 2, image.ndim - 1
+    extents = []
+    for axis in (row_axis, col_axis):
+        other = tuple(a for a in range(image.ndim) if a != axis)
+        foreground = np.flatnonzero(
+            (image.max(axis=other) != background) | (image.min(axis=other) != background)
+        )
+        if foreground.size == 0:
+            return (0, image.shape[row_axis], 0, image.shape[col_axis])
+        extents.extend([int(foreground[0]), int(foreground[-1]) + 1])
+    return tuple(extents)
+
+
+def crop(image: np.array, background: float = 0, box: tuple = None) -> np.array:
+    """Crops an image to the extent of its non-background pixels.
 
-    return image
+    Args:
+        image (np.ndarray): Image (rows, cols), or volume (slices, rows, cols).
+        background (float): The background value.
+        box (tuple): Optional (top, bottom, left, right) box, e.g. from bounding_box.
+
+    Returns a view of the image.
+    """
+    top, bottom, left, right = box or bounding_box(image, background=background)
+    return image[..., top:bottom, left:right]
+
+
+def crop_study(volume: np.ndarray, background: float = 0, box: tuple = None) -> tuple:
+    """Crops every slice of a study to the same union bounding box.
+
+    Args:
+        volume (np.ndarray): Volume with shape (slices, rows, cols).
+        background (float): The background value.
+        box (tuple): Optional (top, bottom, left, right) box, for instance one cached from a
+            previous call. If None, the union box over all slices is computed.
+
+    Returns a tuple of the contiguous cropped volume and the box.
+    """
+    box = box or bounding_box(volume, background=background)
+    return np.ascontiguousarray(crop(volume, box=box)), box
 
 
 class Crop(layers.Layer):
-    def __init__(self, **kwargs) -> None:
-        super().__init__(**kwargs)
+    """Crops an image tensor to the extent of its non-background pixels.
+
+    Accepts (rows, cols) or (rows, cols, channels) tensors. As with bounding_box, the extent is
+    found from row and column projections. The output has a dynamic shape, so Crop is normally
+    followed by Resize.
+
+    Args:
+        background (float): The background value.
+    """
 
-    def call(self, image: np.array) -> np.array:
-        return crop(image=image, keep_size=self._keep_size)
+    def __init__(self, background: float = 0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._background = background
+
+    def call(self, image: tf.Tensor) -> tf.Tensor:
+        background = tf.cast(self._background, image.dtype)
+        shape = tf.shape(image)
+        bounds = []
+        for axis in (0, 1):
+            other = [a for a in range(image.shape.rank) if a != axis]
+            foreground = tf.logical_or(
+                tf.not_equal(tf.reduce_max(image, axis=other), background),
+                tf.not_equal(tf.reduce_min(image, axis=other), background),
+            )
+            indices = tf.cast(tf.where(foreground)[:, 0], tf.int32)
+            start, stop = tf.cond(
+                tf.size(indices) > 0,
+                lambda: (indices[0], indices[-1] + 1),  # noqa B023
+                lambda: (tf.constant(0), shape[axis]),  # noqa B023
+            )
+            bounds.extend([start, stop])
+        top, bottom, left, right = bounds
+        return image[top:bottom, left:right]
+
+    def get_config(self) -> dict:
+        config = super().get_config()
+        config.update({"background": self._background})
+        return config
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -140,8 +368,91 @@ class Resize(layers.Layer):
     """
 
     def __init__(self, output_shape: tuple, **kwargs) -> None:
-        super().__init__(kwargs)
+        super().__init__(**kwargs)
         self._output_shape = output_shape
 
-    def call(self, image: np.array) -> np.array:
-        return resize(image=image, output_shape=self._output_shape)
+    def call(self, image: tf.Tensor) -> tf.Tensor:
+        """Resizes a (rows, cols) or (rows, cols, channels) tensor to a float32 tensor."""
+        if image.shape.rank == 2:
+            return tf.image.resize(image[..., tf.newaxis], size=self._output_shape)[..., 0]
+        return tf.image.resize(image, size=self._output_shape)
+
+    def get_config(self) -> dict:
+        config = super().get_config()
+        config.update({"output_shape": self._output_shape})
+        return config
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        RESAMPLE                                                  #
+# ------------------------------------------------------------------------------------------------ #
+
+
+def resample(
+    volume: np.ndarray,
+    spacing: tuple,
+    target_spacing: tuple = (1.0, 1.0, 1.0),
+    output_shape: tuple = None,
+    n_workers: int = 8,
+) -> np.ndarray:
+    """Resamples a study volume to a target voxel spacing or output shape.
+
+    Linear interpolation is applied separably, one axis at a time, starting with the axis that
+    shrinks the most so later passes work on less data. Each pass is split into slabs along
+    another axis which are interpolated concurrently by a thread pool. All computation is float32.
+
+    Args:
+        volume (np.ndarray): Volume with shape (slices, rows, cols).
+        spacing (tuple): The volume's (slice, row, column) spacing in mm, e.g. Study.spacing.
+        target_spacing (tuple): The output spacing in mm. Ignored if output_shape is given.
+        output_shape (tuple): Optional (slices, rows, cols) output shape.
+        n_workers (int): The number of threads per pass.
+
+    Returns a float32 volume.
+    """
+    if output_shape is None:
+        output_shape = tuple(
+            max(1, int(round(n * s / t))) for n, s, t in zip(volume.shape, spacing, target_spacing)
+        )
+    data = volume.astype(np.float32, copy=False)
+    axes = sorted(range(3), key=lambda axis: output_shape[axis] / volume.shape[axis])
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for axis in axes:
+            if output_shape[axis] != data.shape[axis]:
+                data = _resample_axis(data, axis, output_shape[axis], executor, n_workers)
+    return data if data is not volume else data.copy()
+
+
+def _resample_axis(
+    data: np.ndarray, axis: int, n_out: int, executor: ThreadPoolExecutor, n_slabs: int
+) -> np.ndarray:
+    """Linearly interpolates data along one axis, aligning voxel centers."""
+    n_in = data.shape[axis]
+    coords = (np.arange(n_out, dtype=np.float32) + 0.5) * (n_in / n_out) - 0.5
+    coords = np.clip(coords, 0, n_in - 1)
+    lower = np.floor(coords).astype(np.intp)
+    upper = np.minimum(lower + 1, n_in - 1)
+    shape = [1] * data.ndim
+    shape[axis] = n_out
+    weights = (coords - lower).astype(np.float32).reshape(shape)
+
+    out_shape = list(data.shape)
+    out_shape[axis] = n_out
+    out = np.empty(out_shape, dtype=np.float32)
+
+    split_axis = 1 if axis == 0 else 0
+    bounds = np.linspace(0, data.shape[split_axis], min(n_slabs, data.shape[split_axis]) + 1)
+
+    def interpolate(start: int, stop: int) -> None:
+        index = [slice(None)] * data.ndim
+        index[split_axis] = slice(start, stop)
+        index = tuple(index)
+        lo = np.take(data[index], lower, axis=axis)
+        hi = np.take(data[index], upper, axis=axis)
+        np.subtract(hi, lo, out=hi)
+        np.multiply(hi, weights, out=hi)
+        np.add(lo, hi, out=out[index])
+
+    slabs = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if int(b) > int(a)]
+    list(executor.map(lambda slab: interpolate(*slab), slabs))
+    return out
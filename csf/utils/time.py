@@ -11,21 +11,21 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday October 25th 2022 09:52:13 am                                               #
-# Modified   : Tuesday October 25th 2022 11:29:24 am                                               #
+# Modified   : Friday October 16th 2026 10:34:35 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-from datetime import datetime
+from datetime import timedelta
 
 # ------------------------------------------------------------------------------------------------ #
 
 
-def time_format(self, seconds: int) -> str:
+def time_format(seconds: int) -> str:
     """Returns the time in hours, minutes, and seconds format.
 
     Args:
         seconds (int): Number of seconds of elapsed time
 
     """
-    return str(datetime.timedelta(seconds=seconds))
+    return str(timedelta(seconds=int(seconds)))
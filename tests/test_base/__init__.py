@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Automated Essay Scoring: A Data-First Deep Learning Approach                        #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /__init__.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/English-Language-Learning                          #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday September 5th 2022 04:51:01 pm                                               #
+# Modified   : Monday September 5th 2022 04:51:02 pm                                               #
+# ------------------------------------------------------------------------------------------------ #
+# License    : BSD 3-Clause "New" or "Revised" License                                             #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_cache.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:25:08 pm                                                #
+# Modified   : Friday October 16th 2026 11:12:18 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+# Enter imports for modules and classes being tested here
+from csf.base.io import IO, IOFactory
+from csf.data.transforms import windower
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.cache
+class TestReadCache:
+    def test_read_cache(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("vol")
+        filepaths = [str(tmp_path / "{}.vol".format(i)) for i in range(3)]
+        for filepath in filepaths:
+            io.write(filepath, np.zeros((4, 16, 16), dtype=np.int16), compression=None)
+
+        cache = IO.enable_cache(max_bytes=2 * 4 * 16 * 16 * 2)
+        try:
+            first = io.read(filepaths[0])
+            assert first.flags.writeable
+            first[0] = 1
+            second = io.read(filepaths[0])
+            assert second is not first
+            assert second.flags.writeable
+            assert second.max() == 0
+            assert io.read(filepaths[0], slab=1) is not first
+            assert cache.hits == 1
+            assert cache.misses == 2
+
+            io.read(filepaths[1])
+            io.read(filepaths[2])
+            assert cache.evictions == 2
+            assert cache.nbytes <= cache.max_bytes
+
+            io.write(filepaths[2], np.ones((4, 16, 16), dtype=np.int16), compression=None)
+            os.utime(filepaths[2], ns=(0, 0))
+            assert io.read(filepaths[2]).max() == 1
+            assert IO.cache_stats()["misses"] == 5
+        finally:
+            IO.disable_cache()
+
+        assert IO.cache_stats() is None
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_mutable_values(self, study_directory, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "data.csv")
+        IOFactory.create("csv").write(filepath, pd.DataFrame({"a": [1, 2, 3]}))
+        dicom = os.path.join(study_directory, os.listdir(study_directory)[0], "0.dcm")
+
+        IO.enable_cache()
+        try:
+            io = IOFactory.create("csv")
+            data = io.read(filepath)
+            data["a"] = 99
+            assert io.read(filepath)["a"].tolist() == [1, 2, 3]
+            io.read(filepath)["a"] = 99
+            assert io.read(filepath)["a"].tolist() == [1, 2, 3]
+
+            for _ in range(2):
+                image = IOFactory.create("dcm").read(dicom, mode="pixels")
+                assert image.pixels.min() > 1024
+                image.pixels[:] = windower(image.pixels, window=(100, 0))
+                assert image.pixels.max() == 50
+            assert IO.cache_stats()["hits"] >= 1
+
+            raw = IOFactory.create("dcm").read(dicom)
+            assert isinstance(raw, tf.Tensor)
+            assert IO.cache_stats()["nbytes"] >= len(raw.numpy())
+        finally:
+            IO.disable_cache()
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_io.py                                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:20:10 pm                                                #
+# Modified   : Friday October 16th 2026 11:10:45 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+import nibabel as nib
+import pydicom
+from pydicom.dataset import FileDataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+# Enter imports for modules and classes being tested here
+from csf.base import file_formats
+from csf.base.io import IOFactory, DicomImage
+from csf.base.mask import RLEMask
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.fixture
+def nifti_filepath(tmp_path):
+    data = np.zeros((16, 16, 8), dtype=np.uint8)
+    data[4:8, 4:8, 2] = 1
+    data[6:10, 6:10, 5] = 7
+    img = nib.Nifti1Image(data, affine=np.eye(4))
+    img.set_data_dtype(np.uint8)
+    filepath = str(tmp_path / "segmentation.nii")
+    nib.save(img, filepath)
+    return filepath
+
+
+@pytest.fixture
+def dicom_filepath(tmp_path):
+    filepath = str(tmp_path / "1.dcm")
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = pydicom.uid.CTImageStorage
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds = FileDataset(filepath, {}, file_meta=meta, preamble=b"\0" * 128)
+    ds.StudyInstanceUID = "1.2.826.0.1.3680043.12281"
+    ds.InstanceNumber = 1
+    ds.PixelSpacing = [0.5, 0.5]
+    ds.RescaleSlope = 1
+    ds.RescaleIntercept = -1024
+    ds.Rows = 8
+    ds.Columns = 8
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 1
+    ds.PixelData = np.arange(64, dtype=np.int16).reshape(8, 8).tobytes()
+    ds.save_as(filepath, enforce_file_format=True)
+    return filepath
+
+
+@pytest.mark.io
+class TestNibabelIO:
+    def test_fdata(self, nifti_filepath, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("nii")
+        data = io.read(nifti_filepath)
+        assert data.dtype == np.float64
+        assert data.shape == (16, 16, 8)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_native(self, nifti_filepath, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("nii")
+        data = io.read(nifti_filepath, mode="native")
+        assert data.dtype == np.uint8
+        assert data.max() == 7
+
+        data = io.read(nifti_filepath, mode="native", dtype=np.int16)
+        assert data.dtype == np.int16
+
+        header = nib.load(nifti_filepath).header
+        header["scl_slope"], header["scl_inter"] = 2.0, 0.0
+        with open(nifti_filepath, "r+b") as f:
+            header.write_to(f)
+        data = io.read(nifti_filepath, mode="native", slab=5)
+        assert data.dtype == np.uint8
+        assert data.max() == 7
+        assert io.read(nifti_filepath, mode="native", dtype=np.float32).max() == 14
+        assert io.read(nifti_filepath).max() == 14
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_slab(self, nifti_filepath, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("nii")
+        data = io.read(nifti_filepath, mode="native", slab=5)
+        assert data.shape == (16, 16)
+        assert data.max() == 7
+
+        data = io.read(nifti_filepath, mode="native", slab=slice(1, 4))
+        assert data.shape == (16, 16, 3)
+        assert data[:, :, 1].sum() == 16
+
+        data = io.read(nifti_filepath, slab=slice(0, 3), axis=0)
+        assert data.shape == (3, 16, 8)
+        assert data.dtype == np.float64
+
+        proxy = io.read(nifti_filepath, mode="proxy")
+        assert proxy.shape == (16, 16, 8)
+        assert np.asarray(proxy[:, :, 2]).sum() == 16
+
+        with pytest.raises(ValueError):
+            io.read(nifti_filepath, mode="invalid")
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.io
+class TestDicomIO:
+    def test_pixels(self, dicom_filepath, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("dcm")
+        image = io.read(dicom_filepath, mode="pixels")
+        assert isinstance(image, DicomImage)
+        assert image.pixels.dtype == np.int16
+        assert image.pixels.shape == (8, 8)
+        assert image.slope == 1.0
+        assert image.intercept == -1024.0
+        assert "PixelData" not in image.header
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_unsigned(self, dicom_filepath, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("dcm")
+        for maximum in (32767, 65535):
+            stored = np.linspace(0, maximum, 64).astype(np.uint16).reshape(8, 8)
+            ds = pydicom.dcmread(dicom_filepath)
+            ds.PixelRepresentation = 0
+            ds.RescaleSlope = 2
+            ds.PixelData = stored.tobytes()
+            ds.save_as(dicom_filepath)
+
+            image = io.read(dicom_filepath, mode="pixels")
+            assert image.pixels.dtype == np.int16
+            rescaled = image.pixels.astype(np.float64) * image.slope + image.intercept
+            assert np.array_equal(rescaled, stored.astype(np.float64) * 2 - 1024)
+        assert image.intercept == -1024.0 + 2 * 32768
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_header_and_tags(self, dicom_filepath, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        io = IOFactory.create("dcm")
+        header = io.read(dicom_filepath, mode="header")
+        assert "PixelData" not in header
+        assert header.InstanceNumber == 1
+
+        tags = io.read(
+            dicom_filepath, mode="tags", tags=["InstanceNumber", "PixelSpacing", "SliceThickness"]
+        )
+        assert tags["InstanceNumber"] == 1
+        assert type(tags["InstanceNumber"]) is int
+        assert tags["PixelSpacing"] == [0.5, 0.5]
+        assert all(type(spacing) is float for spacing in tags["PixelSpacing"])
+        assert tags["SliceThickness"] is None
+
+        with pytest.raises(ValueError):
+            io.read(dicom_filepath, mode="tags")
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.io
+class TestCSVIO:
+    def test_cache(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "train.csv")
+        data = pd.DataFrame(
+            {
+                "StudyInstanceUID": ["1.2.826.0.1.3680043.{}".format(i) for i in range(10)],
+                "patient_overall": [0, 1] * 5,
+                **{"C{}".format(i): [0, 1] * 5 for i in range(1, 8)},
+            }
+        )
+        data.to_csv(filepath, index=False)
+
+        io = IOFactory.create("csv")
+        df = io.read(filepath, cache=True)
+        assert os.path.exists(io.cache_filepath(filepath))
+        assert isinstance(df["StudyInstanceUID"].dtype, pd.CategoricalDtype)
+        assert all(df["C{}".format(i)].dtype == np.int8 for i in range(1, 8))
+
+        df = io.read(filepath, cache=True, usecols=["StudyInstanceUID", "C1"], index_col=0)
+        assert df.index.name == "StudyInstanceUID"
+        assert list(df.columns) == ["C1"]
+
+        data.iloc[:5].to_csv(filepath, index=False)
+        df = io.read(filepath, cache=True)
+        assert df.shape == (5, 9)
+
+        with open(io.cache_filepath(filepath), "wb") as f:
+            f.write(b"PAR1 truncated")
+        assert not io.is_cached(filepath)
+        df = io.read(filepath, cache=True)
+        assert df.shape == (5, 9)
+        assert io.is_cached(filepath)
+        assert not [name for name in os.listdir(tmp_path) if ".tmp" in name]
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_iterate(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "train_bounding_boxes.csv")
+        data = pd.DataFrame(
+            {
+                "StudyInstanceUID": ["1.2.826.0.1.3680043.{}".format(i % 4) for i in range(100)],
+                "x": np.arange(100, dtype=float),
+                "slice_number": np.arange(100),
+            }
+        )
+        data.to_csv(filepath, index=False)
+        keep = ["1.2.826.0.1.3680043.1", "1.2.826.0.1.3680043.2"]
+
+        io = IOFactory.create("csv")
+        for cache in (False, True):
+            if cache:
+                io.read(filepath, cache=True)
+            chunks = list(
+                io.iterate(
+                    filepath,
+                    chunksize=30,
+                    usecols=["slice_number"],
+                    where={"StudyInstanceUID": keep},
+                )
+            )
+            assert len(chunks) == 4
+            assert all(len(chunk) <= 30 for chunk in chunks)
+            df = pd.concat(chunks)
+            assert list(df.columns) == ["slice_number"]
+            assert df.shape[0] == 50
+            assert set(df["slice_number"] % 4) == {1, 2}
+
+            chunks = list(io.iterate(filepath, where={"slice_number": {3, 4, 500}}))
+            assert pd.concat(chunks)["slice_number"].tolist() == [3, 4]
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.io
+class TestVolumeIO:
+    def test_volume(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "1.2.826.0.1.3680043.12281.vol")
+        data = np.arange(5 * 8 * 8, dtype=np.int16).reshape(5, 8, 8)
+        metadata = {"study_id": "1.2.826.0.1.3680043.12281", "spacing": (1.25, 0.5, 0.5)}
+
+        io = IOFactory.create("vol")
+        io.write(filepath, data, metadata=metadata)
+        assert np.array_equal(io.read(filepath), data)
+        assert np.array_equal(io.read(filepath, slab=3), data[3])
+        assert np.array_equal(io.read(filepath, slab=slice(1, 3)), data[1:3])
+
+        meta = io.read(filepath, metadata=True)
+        assert meta["study_id"] == metadata["study_id"]
+        assert meta["spacing"] == metadata["spacing"]
+        assert meta["shape"] == (5, 8, 8)
+        assert meta["dtype"] == "int16"
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.io
+class TestMaskIO:
+    def test_mask(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "1.2.826.0.1.3680043.12281.mask")
+        mask = np.zeros((16, 16, 6), dtype=np.uint8)
+        mask[2:10, 4:12, 1:5] = 2
+        mask[5:7, 5:7, 3] = 7
+
+        io = IOFactory.create("mask")
+        io.write(filepath, mask)
+        assert np.array_equal(io.read(filepath), mask)
+        assert np.array_equal(io.read(filepath, index=3), mask[:, :, 3])
+        assert np.array_equal(io.read(filepath, index=-1), mask[:, :, 5])
+        rle = io.read(filepath, encoded=True)
+        assert isinstance(rle, RLEMask)
+        assert rle.nbytes < mask.nbytes
+
+        io.write(filepath, RLEMask.encode(mask.transpose(2, 0, 1), axis=0))
+        assert np.array_equal(io.read(filepath, index=3), mask[:, :, 3])
+        with pytest.raises(ValueError):
+            io.read(filepath, index=6)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.io
+class TestIOFactory:
+    def test_file_formats(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        assert len(set(file_formats)) == len(file_formats)
+        for ftype in file_formats:
+            assert IOFactory.create(ftype) is not None
+        with pytest.raises(ValueError):
+            IOFactory.create("jpg")
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
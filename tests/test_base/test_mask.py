@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_mask.py                                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:44:07 pm                                                #
+# Modified   : Friday October 16th 2026 10:46:25 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+# Enter imports for modules and classes being tested here
+from csf.base.mask import RLEMask
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.fixture
+def mask():
+    mask = np.zeros((32, 24, 10), dtype=np.uint8)
+    mask[4:20, 6:18, 2:8] = 3
+    mask[10:14, 8:12, 4:6] = 5
+    mask[:, :, 9] = 1
+    return mask
+
+
+@pytest.mark.mask
+class TestRLEMask:
+    def test_encode(self, mask, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        rle = RLEMask.encode(mask)
+        assert rle.shape == mask.shape
+        assert rle.n_slices == 10
+        assert rle.values.dtype == np.uint8
+        assert len(rle.offsets) == 11
+        assert rle.lengths.sum() == 32 * 24 * 8
+        assert rle.nbytes < mask.nbytes / 4
+        assert np.array_equal(rle.decode(), mask)
+        for index in range(10):
+            assert np.array_equal(rle.decode_slice(index), mask[:, :, index])
+        assert np.array_equal(rle.decode_slice(-1), mask[:, :, 9])
+        assert rle.box == ((0, 32), (0, 24), (2, 10))
+        assert rle.offsets[0] == rle.offsets[2] == 0
+        assert rle.offsets[10] - rle.offsets[9] == 1
+
+        rle = RLEMask.encode(mask[:, :, :8])
+        assert rle.box == ((4, 20), (6, 18), (2, 8))
+        assert np.array_equal(rle.decode(), mask[:, :, :8])
+        assert np.array_equal(rle.decode_slice(5), mask[:, :, 5])
+        assert not rle.decode_slice(0).any()
+
+        with pytest.raises(ValueError):
+            rle.decode_slice(10)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_axis(self, mask, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        rng = np.random.default_rng(3)
+        labels = rng.integers(0, 8, size=(6, 5, 4), dtype=np.int16)
+        for axis in (0, 1, -1):
+            rle = RLEMask.encode(labels, axis=axis)
+            assert np.array_equal(rle.decode(), labels)
+            assert np.array_equal(rle.decode_slice(2), np.take(labels, 2, axis=axis))
+
+        for empty in (np.zeros((4, 4, 0), dtype=np.uint8), np.zeros((4, 4, 3), dtype=np.uint8)):
+            rle = RLEMask.encode(empty)
+            assert rle.n_runs == 0
+            assert np.array_equal(rle.decode(), empty)
+        assert not rle.decode_slice(1).any()
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_writer.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:28:11 pm                                                #
+# Modified   : Friday October 16th 2026 11:13:42 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import pandas as pd
+
+# Enter imports for modules and classes being tested here
+from csf.base.io import IO, IOFactory
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.writer
+class TestWriteBehind:
+    def test_atomic_write(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "out" / "data.pkl")
+        io = IOFactory.create("pkl")
+        io.write(filepath, {"a": 1})
+        assert io.read(filepath) == {"a": 1}
+
+        with pytest.raises(Exception):
+            io.write(filepath, lambda x: x)
+        assert io.read(filepath) == {"a": 1}
+        assert os.listdir(os.path.dirname(filepath)) == ["data.pkl"]
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_background_write(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        writer = IO.enable_write_behind(n_workers=2, max_pending=2)
+        try:
+            io = IOFactory.create("csv")
+            data = pd.DataFrame({"x": range(100)})
+            futures = [
+                io.write(str(tmp_path / "{}.csv".format(i)), data, background=True)
+                for i in range(8)
+            ]
+            IO.flush()
+            assert all(future.done() for future in futures)
+            assert writer.pending == 0
+            assert len(os.listdir(tmp_path)) == 8
+
+            IOFactory.create("pkl").write(str(tmp_path / "bad.pkl"), lambda x: x, background=True)
+            with pytest.raises(Exception):
+                IO.flush()
+            assert not os.path.exists(tmp_path / "bad.pkl")
+        finally:
+            IO.disable_write_behind()
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_shutdown_after_error(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        writer = IO.enable_write_behind(n_workers=1)
+        IOFactory.create("pkl").write(str(tmp_path / "bad.pkl"), lambda x: x, background=True)
+        with pytest.raises(Exception):
+            IO.disable_write_behind()
+        assert IO._writer is None
+        with pytest.raises(RuntimeError):
+            writer.submit(print)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_alignment.py                                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:48:36 pm                                                #
+# Modified   : Friday October 16th 2026 10:48:36 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import nibabel as nib
+
+# Enter imports for modules and classes being tested here
+from csf.data.alignment import align_slices, AlignmentIndex, SliceAlignment
+from csf.data.etl import SliceAlignmentBuilder
+from conftest import STUDY_ID, N_SLICES
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+def affine(origin: float, step: float = 1.25) -> np.ndarray:
+    """Returns a NIfTI affine with slices step mm apart starting at z = origin."""
+    return np.array(
+        [[-0.5, 0.0, 0.0, 4.0], [0.0, -0.5, 0.0, 4.0], [0.0, 0.0, step, origin], [0, 0, 0, 1]]
+    )
+
+
+@pytest.mark.alignment
+class TestAlignSlices:
+    def test_align(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        instance_numbers = np.arange(1, 7)
+        positions = np.stack(
+            [np.full(6, -60.0), np.full(6, 80.0), -1.25 * instance_numbers], axis=1
+        )
+
+        table = align_slices(affine(-7.5), 6, instance_numbers, positions)
+        assert table["instance_number"].tolist() == [6, 5, 4, 3, 2, 1]
+        assert np.allclose(table["distance"], 0)
+
+        table = align_slices(affine(-1.25, step=-1.25), 6, instance_numbers, positions)
+        assert table["instance_number"].tolist() == [1, 2, 3, 4, 5, 6]
+
+        table = align_slices(affine(-8.0, step=0.625), 8, instance_numbers[::-1], positions[::-1])
+        assert table["instance_number"].tolist() == [6, 6, 5, 5, 4, 4, 3, 3]
+        assert np.allclose(table["distance"], [0.5, 0.125] * 4)
+
+        table = align_slices(affine(0.0), 2, instance_numbers[:1], positions[:1])
+        assert table["instance_number"].tolist() == [1, 1]
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_slice_alignment(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        instance_numbers = np.arange(1, 7)
+        positions = np.stack([np.zeros(6), np.zeros(6), -1.25 * instance_numbers], axis=1)
+        table = align_slices(affine(-8.0, step=0.625), 8, instance_numbers, positions)
+
+        alignment = SliceAlignment.from_table(STUDY_ID, table)
+        assert alignment.reversed
+        assert alignment.to_dicom(0) == 6
+        assert alignment.to_nifti(6) == 1
+        assert alignment.to_nifti(4) == 5
+        assert alignment.to_nifti(2) == -1
+        assert alignment.to_nifti(100) == -1
+        with pytest.raises(ValueError):
+            alignment.to_dicom(8)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.alignment
+class TestSliceAlignmentBuilder:
+    def test_builder(self, study_directory, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        labels = np.zeros((4, 4, N_SLICES), dtype=np.uint8)
+        filepath = str(tmp_path / "{}.nii".format(STUDY_ID))
+        nib.save(nib.Nifti1Image(labels, affine(-1.25 * N_SLICES)), filepath)
+
+        target = str(tmp_path / "slice_alignment.parquet")
+        params = {
+            "source": str(tmp_path / "*.nii"),
+            "dicom_directory": study_directory,
+            "target": target,
+            "n_jobs": 1,
+            "verbose": 0,
+        }
+        builder = SliceAlignmentBuilder(**params)
+        table = builder.execute()
+        assert os.path.exists(target)
+        assert len(table) == N_SLICES
+        assert builder.return_code()
+
+        index = AlignmentIndex(target)
+        assert index.studies == [STUDY_ID]
+        assert index.get(STUDY_ID).reversed
+        for nifti_slice in range(N_SLICES):
+            assert index.to_dicom(STUDY_ID, nifti_slice) == N_SLICES - nifti_slice
+            assert index.to_nifti(STUDY_ID, N_SLICES - nifti_slice) == nifti_slice
+        with pytest.raises(ValueError):
+            index.get("1.2.3")
+
+        mtime = os.path.getmtime(target)
+        SliceAlignmentBuilder(**params).execute()
+        assert os.path.getmtime(target) == mtime
+
+        with pytest.raises(FileNotFoundError):
+            AlignmentIndex(str(tmp_path / "missing.parquet"))
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_cache.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:26:32 pm                                                #
+# Modified   : Friday October 16th 2026 11:12:39 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+# Enter imports for modules and classes being tested here
+from csf.data.cache import TransformCache
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.cache
+class TestTransformCache:
+    def test_run(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "source.npy")
+        np.save(filepath, np.arange(64, dtype=np.int16).reshape(8, 8))
+        calls = []
+
+        def scale(image, factor):
+            calls.append("scale")
+            return image * factor
+
+        def clip(image, window):
+            calls.append("clip")
+            return np.clip(image, *window)
+
+        cache = TransformCache(directory=str(tmp_path / "cache"))
+        steps = [("scale", scale, {"factor": 2}), ("clip", clip, {"window": (0, 50)})]
+        first = cache.run(filepath, np.load, steps)
+        assert calls == ["scale", "clip"]
+
+        second = cache.run(filepath, np.load, steps)
+        assert np.array_equal(first, second)
+        assert calls == ["scale", "clip"]
+
+        steps[1] = ("clip", clip, {"window": (0, 100)})
+        cache.run(filepath, np.load, steps)
+        assert calls == ["scale", "clip", "clip"]
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_eviction(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        data = np.zeros(1024, dtype=np.uint8)
+        cache = TransformCache(directory=str(tmp_path / "cache"), max_bytes=3 * 1024)
+        keys = [TransformCache.key("source", "step", {"i": i}) for i in range(4)]
+        for key in keys:
+            cache.put(key, data)
+        assert cache.nbytes <= 3 * 1024
+        assert not cache.exists(keys[0])
+        assert cache.exists(keys[3])
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_key(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        kernel = np.zeros(10000, dtype=np.float32)
+        changed = kernel.copy()
+        changed[5000] = 1
+        key = TransformCache.key("source", "filter", {"kernel": kernel})
+        assert key == TransformCache.key("source", "filter", {"kernel": kernel.copy()})
+        assert key != TransformCache.key("source", "filter", {"kernel": changed})
+        assert key != TransformCache.key("source", "filter", {"kernel": kernel.astype(np.float64)})
+        assert key != TransformCache.key("source", "filter", {"kernel": kernel.reshape(100, 100)})
+        assert TransformCache.key("source", "scale", {"factor": np.float32(2)}) == (
+            TransformCache.key("source", "scale", {"factor": 2.0})
+        )
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_failed_put(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = TransformCache(directory=str(tmp_path / "cache"))
+        key = TransformCache.key("source", "step")
+        unpicklable = np.array([lambda: 0], dtype=object)
+        with pytest.raises(Exception):
+            cache.put(key, unpicklable)
+        assert not cache.exists(key)
+        assert cache.nbytes == 0
+        for _, _, filenames in os.walk(str(tmp_path / "cache")):
+            assert not any(filename.endswith(".tmp") for filename in filenames)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
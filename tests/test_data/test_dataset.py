@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_dataset.py                                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:35:24 pm                                                #
+# Modified   : Friday October 16th 2026 10:56:50 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import pandas as pd
+import numpy as np
+
+# Enter imports for modules and classes being tested here
+from csf.config.runtime import RuntimeConfig
+from csf.data.dataset import DatasetBuilder, TARGETS
+from csf.data.etl import StudyPreprocessor
+from conftest import STUDY_ID, N_SLICES
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.dataset
+class TestDatasetBuilder:
+    def test_dataset(self, study_directory, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        target = str(tmp_path / "processed")
+        StudyPreprocessor(
+            source=study_directory, target=target, output_shape=(8, 8), n_jobs=1, verbose=0
+        ).execute()
+        labels_filepath = str(tmp_path / "train.csv")
+        labels = pd.DataFrame(
+            [[STUDY_ID, 1, 0, 1, 0, 0, 0, 0, 0]], columns=["StudyInstanceUID"] + TARGETS
+        )
+        labels.to_csv(labels_filepath, index=False)
+
+        runtime = RuntimeConfig()
+        builder = DatasetBuilder(
+            runtime, directory=target, labels_filepath=labels_filepath, global_batch_size=4
+        )
+        assert builder.studies["StudyInstanceUID"].tolist() == [STUDY_ID]
+
+        batches = list(builder.dataset(training=False))
+        assert [images.shape[0] for images, _ in batches] == [4, N_SLICES - 4]
+        images, targets = batches[0]
+        assert images.shape[1:] == (8, 8, 1)
+        assert np.all((images.numpy() >= 0) & (images.numpy() <= 1))
+        assert np.array_equal(targets.numpy()[0], [1, 0, 1, 0, 0, 0, 0, 0])
+
+        images, targets = next(iter(builder.build(training=True)))
+        assert images.shape == (4, 8, 8, 1)
+
+        builder = DatasetBuilder(
+            runtime,
+            directory=target,
+            labels_filepath=labels_filepath,
+            global_batch_size=4,
+            cache=str(tmp_path / "cache"),
+        )
+        for _ in range(2):
+            batches = list(builder.dataset(training=False))
+            assert sum(images.shape[0] for images, _ in batches) == N_SLICES
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_etl.py                                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:34:22 pm                                                #
+# Modified   : Friday October 16th 2026 10:59:56 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import pandas as pd
+import nibabel as nib
+import tensorflow as tf
+
+# Enter imports for modules and classes being tested here
+from csf.base.io import IOFactory
+from csf.data.etl import SegmentationVertebraeExtractor, StudyPreprocessor, TFRecordExporter
+from csf.data.tfrecord import parse_example, TARGETS, VERTEBRAE
+from conftest import STUDY_ID, N_SLICES
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.etl
+class TestSegmentationVertebraeExtractor:
+    def test_extract(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        labels = np.zeros((8, 8, 70), dtype=np.uint8)
+        labels[2:4, 2:4, 0] = 1
+        labels[4:6, 4:6, 0] = 7
+        labels[0, 0, 1] = 9
+        labels[1:3, 1:3, 66:69] = 3
+        nib.save(nib.Nifti1Image(labels, np.eye(4)), str(tmp_path / "{}.nii".format(STUDY_ID)))
+
+        target = str(tmp_path / "vertebrae.csv")
+        extractor = SegmentationVertebraeExtractor(
+            input_path=str(tmp_path / "*.nii"),
+            output_path=target,
+            n_jobs=1,
+            verbose=0,
+        )
+        vertebrae = extractor.execute()
+        assert os.path.exists(target)
+        assert list(vertebrae.columns) == ["StudyInstanceUID", "SliceNumber"] + VERTEBRAE
+        assert len(vertebrae) == 70
+        assert (vertebrae["StudyInstanceUID"] == STUDY_ID).all()
+
+        slices = vertebrae.set_index("SliceNumber")[VERTEBRAE]
+        assert slices.loc[70].tolist() == [1, 0, 0, 0, 0, 0, 1]
+        assert slices.loc[69].sum() == 0
+        assert slices.loc[[2, 3, 4], "C3"].tolist() == [1, 1, 1]
+        assert slices.drop([70, 2, 3, 4]).to_numpy().sum() == 0
+        assert isinstance(extractor.duration, str)
+        assert extractor.return_code()
+
+        mtime = os.path.getmtime(target)
+        assert extractor.manifest == target + ".manifest.csv"
+        SegmentationVertebraeExtractor(source=str(tmp_path / "*.nii"), target=target).execute()
+        assert os.path.getmtime(target) == mtime
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_incremental(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        def save(study_id, label, n_slices=4):
+            labels = np.full((4, 4, n_slices), label, dtype=np.uint8)
+            nib.save(nib.Nifti1Image(labels, np.eye(4)), str(tmp_path / "{}.nii".format(study_id)))
+
+        params = {
+            "source": str(tmp_path / "*.nii"),
+            "target": str(tmp_path / "vertebrae.csv"),
+            "digest": True,
+            "n_jobs": 1,
+            "verbose": 0,
+        }
+        save("1.2.826.1", 1)
+        save("1.2.826.2", 2)
+        extractor = SegmentationVertebraeExtractor(**params)
+        extractor.execute()
+        assert extractor.n_extracted == 2
+
+        save("1.2.826.2", 5, n_slices=3)
+        save("1.2.826.3", 3)
+        os.remove(tmp_path / "1.2.826.1.nii")
+        extractor = SegmentationVertebraeExtractor(**params)
+        vertebrae = extractor.execute()
+        assert (extractor.n_extracted, extractor.n_unchanged, extractor.n_removed) == (2, 0, 1)
+        assert vertebrae.groupby("StudyInstanceUID")["C5"].sum().to_dict() == {
+            "1.2.826.2": 3,
+            "1.2.826.3": 0,
+        }
+        assert vertebrae.groupby("StudyInstanceUID")["C3"].sum().to_dict() == {
+            "1.2.826.2": 0,
+            "1.2.826.3": 4,
+        }
+        assert len(IOFactory.create("csv").read(params["target"])) == 7
+
+        filepath = str(tmp_path / "1.2.826.3.nii")
+        os.utime(filepath, ns=(0, os.stat(filepath).st_mtime_ns + 10**9))
+        extractor = SegmentationVertebraeExtractor(**params)
+        extractor.execute()
+        assert extractor.n_extracted == 0
+        assert extractor.n_unchanged == 2
+        manifest = IOFactory.create("csv").read(extractor.manifest)
+        assert manifest["mtime_ns"].tolist()[1] == os.stat(filepath).st_mtime_ns
+        assert manifest["digest"].str.len().tolist() == [64, 64]
+
+        extractor = SegmentationVertebraeExtractor(force=True, **params)
+        extractor.execute()
+        assert extractor.n_extracted == 2
+
+        shared = {**params, "manifest": str(tmp_path / "shared.csv")}
+        other = {**shared, "target": str(tmp_path / "other.csv")}
+        SegmentationVertebraeExtractor(**other).execute()
+        save("1.2.826.4", 4)
+        SegmentationVertebraeExtractor(**shared).execute()
+        extractor = SegmentationVertebraeExtractor(**other)
+        vertebrae = extractor.execute()
+        assert extractor.n_extracted == 3
+        assert "1.2.826.4" in set(vertebrae["StudyInstanceUID"])
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_alignment(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        labels = np.zeros((4, 4, 5), dtype=np.uint8)
+        labels[:, :, 0] = 1
+        labels[:, :, 4] = 7
+        nib.save(nib.Nifti1Image(labels, np.eye(4)), str(tmp_path / "{}.nii".format(STUDY_ID)))
+        alignment = pd.DataFrame(
+            {
+                "StudyInstanceUID": STUDY_ID,
+                "nifti_slice": np.arange(5, dtype=np.int16),
+                "instance_number": np.arange(11, 16, dtype=np.int32),
+                "distance": np.zeros(5, dtype=np.float32),
+            }
+        )
+        alignment_filepath = str(tmp_path / "slice_alignment.parquet")
+        IOFactory.create("parquet").write(alignment_filepath, alignment)
+
+        params = {
+            "source": str(tmp_path / "*.nii"),
+            "target": str(tmp_path / "vertebrae.csv"),
+            "alignment_filepath": alignment_filepath,
+            "n_jobs": 1,
+            "verbose": 0,
+        }
+        vertebrae = SegmentationVertebraeExtractor(**params).execute()
+        slices = vertebrae.set_index("SliceNumber")
+        assert sorted(slices.index) == [11, 12, 13, 14, 15]
+        assert slices.loc[11, "C1"] == 1
+        assert slices.loc[15, "C7"] == 1
+
+        params["alignment_filepath"] = str(tmp_path / "missing.parquet")
+        vertebrae = SegmentationVertebraeExtractor(force=True, **params).execute()
+        assert vertebrae.set_index("SliceNumber").loc[5, "C1"] == 1
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.etl
+class TestStudyPreprocessor:
+    def test_preprocess(self, study_directory, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        target = str(tmp_path / "processed")
+        params = {"source": study_directory, "target": target, "n_jobs": 1, "verbose": 0}
+        preprocessor = StudyPreprocessor(output_shape=(8, 8), window=(400, 40), **params)
+        preprocessor.execute()
+
+        filepath = preprocessor.filepath(STUDY_ID)
+        assert os.path.exists(filepath)
+        volume = IOFactory.create("vol").read(filepath)
+        assert volume.shape == (N_SLICES, 8, 8)
+        metadata = IOFactory.create("vol").read(filepath, metadata=True)
+        assert metadata["study_id"] == STUDY_ID
+        assert metadata["instance_numbers"] == tuple(range(1, N_SLICES + 1))
+        assert preprocessor.n_studies == 1
+        assert preprocessor.bytes_per_second > 0
+        assert isinstance(preprocessor.duration, str)
+        assert preprocessor.return_code()
+
+        mtime = os.path.getmtime(filepath)
+        preprocessor = StudyPreprocessor(output_shape=(8, 8), **params)
+        preprocessor.execute()
+        assert preprocessor.n_skipped == 1
+        assert os.path.getmtime(filepath) == mtime
+
+        preprocessor = StudyPreprocessor(output_shape=(8, 8), force=True, **params)
+        preprocessor.execute()
+        assert preprocessor.n_studies == 1
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.etl
+class TestTFRecordExporter:
+    def test_export(self, study_directory, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        source = str(tmp_path / "processed")
+        StudyPreprocessor(
+            source=study_directory, target=source, output_shape=(8, 8), n_jobs=1, verbose=0
+        ).execute()
+        labels_filepath = str(tmp_path / "train.csv")
+        pd.DataFrame(
+            [[STUDY_ID, 1, 0, 1, 0, 0, 0, 0, 0]], columns=["StudyInstanceUID"] + TARGETS
+        ).to_csv(labels_filepath, index=False)
+        segmentation_filepath = str(tmp_path / "segmentation_metadata.csv")
+        pd.DataFrame(
+            [[STUDY_ID, 2, 0, 1, 0, 0, 0, 0, 0]],
+            columns=["StudyInstanceUID", "SliceNumber"] + VERTEBRAE,
+        ).to_csv(segmentation_filepath, index=False)
+
+        target = str(tmp_path / "tfrecords")
+        exporter = TFRecordExporter(
+            source=source,
+            target=target,
+            labels_filepath=labels_filepath,
+            segmentation_filepath=segmentation_filepath,
+            shard_size=4,
+        )
+        manifest = exporter.execute()
+        assert manifest["n_records"].tolist() == [4, N_SLICES - 4]
+        assert manifest["n_studies"].tolist() == [1, 1]
+
+        filenames = [os.path.join(target, f) for f in manifest["filename"]]
+        dataset = tf.data.TFRecordDataset(filenames, compression_type="GZIP").map(parse_example)
+        examples = list(dataset)
+        assert len(examples) == N_SLICES
+        assert examples[0]["image"].shape == (8, 8, 1)
+        assert examples[0]["study_id"].numpy().decode() == STUDY_ID
+        assert [int(e["slice_number"]) for e in examples] == list(range(1, N_SLICES + 1))
+        assert np.array_equal(examples[1]["vertebrae"].numpy(), [0, 1, 0, 0, 0, 0, 0])
+        assert np.array_equal(examples[0]["vertebrae"].numpy(), [-1] * 7)
+        assert np.array_equal(examples[0]["targets"].numpy(), [1, 0, 1, 0, 0, 0, 0, 0])
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
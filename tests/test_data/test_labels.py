@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_labels.py                                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:37:16 pm                                                #
+# Modified   : Friday October 16th 2026 10:59:56 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import nibabel as nib
+import pandas as pd
+
+# Enter imports for modules and classes being tested here
+from csf.data.labels import build_slice_labels, vertebra_boxes, BOX_COLUMNS, KEYS, VERTEBRAE
+from csf.data.etl import SegmentationBoxExtractor, SliceLabelBuilder
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+STUDIES = ["1.2.826.0.1.3680043.10001", "1.2.826.0.1.3680043.10002"]
+
+
+@pytest.fixture
+def tables():
+    segmentation = pd.DataFrame(
+        {
+            "StudyInstanceUID": np.repeat(STUDIES, 3),
+            "SliceNumber": [1, 2, 3, 1, 2, 3],
+            **{v: [0] * 6 for v in VERTEBRAE},
+        }
+    )
+    segmentation.loc[[1, 4], "C2"] = 1
+    segmentation.loc[[2, 5], "C3"] = 1
+    targets = pd.DataFrame(
+        [[STUDIES[0], 1, 0, 1, 0, 0, 0, 0, 0], [STUDIES[1], 0, 0, 0, 0, 0, 0, 0, 0]],
+        columns=["StudyInstanceUID", "patient_overall"] + VERTEBRAE,
+    )
+    boxes = pd.DataFrame(
+        {
+            "StudyInstanceUID": [STUDIES[0], STUDIES[0]],
+            "x": [10.0, 20.0],
+            "y": [10.0, 5.0],
+            "width": [5.0, 10.0],
+            "height": [5.0, 5.0],
+            "slice_number": [2, 2],
+        }
+    )
+    return segmentation, targets, boxes
+
+
+@pytest.mark.labels
+class TestSliceLabels:
+    def test_build_slice_labels(self, tables, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        labels = build_slice_labels(*tables)
+        assert labels.shape[0] == 6
+        assert isinstance(labels["StudyInstanceUID"].dtype, pd.CategoricalDtype)
+        assert labels["C2"].dtype == np.int8
+        assert labels["C2_label"].tolist() == [0, 1, 0, 0, 0, 0]
+        assert labels["C3_label"].sum() == 0
+        assert labels["patient_overall"].tolist() == [1, 1, 1, 0, 0, 0]
+
+        row = labels.iloc[1]
+        assert (row["x"], row["y"], row["width"], row["height"]) == (10, 5, 20, 10)
+        assert labels["has_box"].tolist() == [0, 1, 0, 0, 0, 0]
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_unknown(self, tables, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        segmentation, targets, boxes = tables
+        study = "1.2.826.0.1.3680043.10003"
+        targets = pd.concat(
+            [
+                targets.iloc[:1],
+                pd.DataFrame([[study, 1, 1, 0, 0, 0, 0, 0, 0]], columns=targets.columns),
+            ]
+        )
+        boxes = pd.concat(
+            [boxes, pd.DataFrame([[study, 1.0, 2.0, 3.0, 4.0, 7]], columns=boxes.columns)]
+        )
+
+        labels = build_slice_labels(segmentation, targets, boxes)
+        assert labels.shape[0] == 7
+        row = labels.set_index(KEYS).loc[(study, 7)]
+        assert row[VERTEBRAE].tolist() == [-1] * 7
+        assert row["C1_fracture"] == 1
+        assert row["C1_label"] == -1
+        assert row["C2_label"] == 0
+        assert row["has_box"] == 1
+
+        missing = labels[labels["StudyInstanceUID"] == STUDIES[1]]
+        assert (missing["patient_overall"] == -1).all()
+        assert missing["C2_label"].tolist() == [0, -1, 0]
+        assert "have no segmentation" in caplog.text
+        assert "missing from the targets" in caplog.text
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_builder(self, tables, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepaths = {}
+        for name, table in zip(["segmentation", "labels", "boxes"], tables):
+            filepaths[name + "_filepath"] = str(tmp_path / "{}.csv".format(name))
+            table.to_csv(filepaths[name + "_filepath"], index=False)
+        target = str(tmp_path / "slice_labels.parquet")
+
+        labels = SliceLabelBuilder(target=target, **filepaths).execute()
+        assert labels.shape == (6, 29)
+        builder = SliceLabelBuilder(target=target, **filepaths)
+        assert builder.execute().shape == (6, 29)
+        assert builder.return_code()
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.labels
+class TestVertebraBoxes:
+    def test_vertebra_boxes(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        rng = np.random.default_rng(7)
+        labels = rng.integers(0, 9, size=(12, 10, 9), dtype=np.uint8)
+        labels[rng.random(labels.shape) < 0.8] = 0
+        labels[:, :, 4] = 0
+
+        boxes = vertebra_boxes(labels, slab_size=4)
+        assert list(boxes.columns) == BOX_COLUMNS
+
+        expected = []
+        for k in range(labels.shape[2]):
+            image = labels[:, ::-1, k].T
+            for label, vertebra in enumerate(VERTEBRAE, 1):
+                rows, columns = np.nonzero(image == label)
+                if len(rows) > 0:
+                    expected.append(
+                        [
+                            columns.min(),
+                            rows.min(),
+                            columns.max() - columns.min() + 1,
+                            rows.max() - rows.min() + 1,
+                            labels.shape[2] - k,
+                            vertebra,
+                            len(rows),
+                        ]
+                    )
+        expected = pd.DataFrame(expected, columns=BOX_COLUMNS)
+        expected = expected.sort_values(["slice_number", "vertebra"], ignore_index=True)
+        assert np.array_equal(boxes.to_numpy(), expected.to_numpy())
+        assert 5 not in boxes["slice_number"].values
+        assert len(vertebra_boxes(np.zeros((4, 4, 2), dtype=np.uint8))) == 0
+
+        slice_numbers = np.arange(101, 101 + labels.shape[2])
+        aligned = vertebra_boxes(labels, slab_size=4, slice_numbers=slice_numbers)
+        assert np.array_equal(
+            np.sort(aligned["slice_number"].unique()),
+            np.sort(slice_numbers[labels.shape[2] - np.unique(boxes["slice_number"])]),
+        )
+        with pytest.raises(ValueError):
+            vertebra_boxes(labels, slice_numbers=slice_numbers[:-1])
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_extractor(self, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        labels = np.zeros((8, 8, 3), dtype=np.uint8)
+        labels[1:4, 2:7, 0] = 2
+        nib.save(nib.Nifti1Image(labels, np.eye(4)), str(tmp_path / "{}.nii".format(STUDIES[0])))
+
+        target = str(tmp_path / "boxes.csv")
+        params = {"source": str(tmp_path / "*.nii"), "target": target, "n_jobs": 1, "verbose": 0}
+        boxes = SegmentationBoxExtractor(**params).execute()
+        assert list(boxes.columns) == ["StudyInstanceUID"] + BOX_COLUMNS
+        row = boxes.iloc[0]
+        assert (row["x"], row["y"], row["width"], row["height"]) == (1, 1, 3, 5)
+        assert (row["slice_number"], row["vertebra"], row["n_voxels"]) == (3, "C2", 15)
+
+        extractor = SegmentationBoxExtractor(**params)
+        assert len(extractor.execute()) == 1
+        assert extractor.return_code()
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
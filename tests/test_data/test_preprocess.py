@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_preprocess.py                                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:33:30 pm                                                #
+# Modified   : Friday October 16th 2026 11:14:37 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+# Enter imports for modules and classes being tested here
+from csf.data.preprocess import preprocess_study, preprocess_chained, benchmark
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.fixture
+def pixels():
+    pixels = np.zeros((8, 64, 64), dtype=np.int16)
+    pixels[:, 10:40, 20:50] = np.random.default_rng(0).integers(500, 3000, size=(8, 30, 30))
+    return pixels
+
+
+@pytest.mark.preprocess
+class TestPreprocess:
+    def test_preprocess_study(self, pixels, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        slopes, intercepts = np.ones(8), np.full(8, -1024.0)
+        window = (400, 40)
+        fused = preprocess_study(pixels, slopes, intercepts, window=window, output_shape=(32, 32))
+        assert fused.volume.shape == (8, 32, 32)
+        assert fused.volume.dtype == np.float32
+        assert fused.box == (10, 40, 20, 50)
+        assert fused.volume.min() >= -160 and fused.volume.max() <= 240
+        assert set(fused.timings) == {"hounsfield", "window", "crop", "resize", "total"}
+        sliced = preprocess_study(
+            pixels, slopes, intercepts, window=window, output_shape=(32, 32), slab_size=3
+        )
+        assert np.array_equal(sliced.volume, fused.volume)
+
+        chained = preprocess_chained(
+            pixels, slopes, intercepts, window=window, output_shape=(32, 32)
+        )
+        assert np.allclose(fused.volume, chained.volume, atol=1e-3)
+
+        df = benchmark(pixels, slopes, intercepts, window=window, output_shape=(32, 32), repeats=1)
+        assert list(df.columns) == ["chained", "fused", "speedup"]
+        assert "total" in df.index
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
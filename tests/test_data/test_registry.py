@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_registry.py                                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:27:22 pm                                                #
+# Modified   : Friday October 16th 2026 11:13:15 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+# Enter imports for modules and classes being tested here
+from csf.data.registry import FileRegistry
+from conftest import STUDY_ID, N_SLICES, IMAGE_SIZE, write_dicom
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.registry
+class TestFileRegistry:
+    def test_manifest(self, study_directory, tmp_path, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        filepath = str(tmp_path / "file_registry.csv")
+        with open(filepath, "w") as f:
+            f.write("name,path,description\ntrain_images,train_images,Training images\n")
+        manifest_filepath = str(tmp_path / "manifest.parquet")
+
+        registry = FileRegistry(
+            filepath=filepath, manifest_filepath=manifest_filepath, base_dir=str(tmp_path)
+        )
+        assert registry.path("train_images") == study_directory
+        registry.refresh()
+
+        assert registry.studies == [STUDY_ID]
+        assert registry.slice_count(STUDY_ID) == N_SLICES
+        slices = registry.slices(STUDY_ID)
+        assert [os.path.basename(s) for s in slices] == [
+            "{}.dcm".format(i) for i in range(N_SLICES)
+        ]
+        assert registry.nbytes(STUDY_ID) == sum(os.path.getsize(s) for s in slices)
+
+        study_id = "1.2.826.0.1.3680043.10001"
+        os.makedirs(os.path.join(study_directory, study_id))
+        write_dicom(
+            os.path.join(study_directory, study_id, "1.dcm"),
+            1,
+            np.zeros((IMAGE_SIZE, IMAGE_SIZE), dtype=np.int16),
+        )
+        write_dicom(
+            os.path.join(study_directory, study_id, "slice.dcm"),
+            2,
+            np.zeros((IMAGE_SIZE, IMAGE_SIZE), dtype=np.int16),
+        )
+        with open(os.path.join(study_directory, study_id, "notes.dcm"), "w") as f:
+            f.write("not a DICOM file")
+        registry.refresh()
+        registry = FileRegistry(
+            filepath=filepath, manifest_filepath=manifest_filepath, base_dir=str(tmp_path)
+        )
+        assert set(registry.studies) == {STUDY_ID, study_id}
+        assert registry.slice_count(study_id) == 2
+        assert registry.manifest.groupby("StudyInstanceUID")["slice_number"].max()[study_id] == 2
+
+        with pytest.raises(ValueError):
+            registry.slices("missing")
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
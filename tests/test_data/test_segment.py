@@ -11,12 +11,13 @@
 # URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday October 27th 2022 06:43:32 pm                                              #
-# Modified   : Tuesday November 1st 2022 05:19:40 pm                                               #
+# Modified   : Friday October 16th 2026 11:11:38 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 import os
+from glob import glob
 import pandas as pd
 import inspect
 import pytest
@@ -29,15 +30,17 @@ from csf.data.etl import SegmentationVertebraeExtractor
 # ------------------------------------------------------------------------------------------------ #
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
+SEGMENTATIONS = "data/input/segmentations/*.nii"
 # ------------------------------------------------------------------------------------------------ #
 
 
 @pytest.mark.vertebrae
+@pytest.mark.skipif(len(glob(SEGMENTATIONS)) == 0, reason="Requires the competition segmentations.")
 class TestVertebraeExtractor:
     def test_vertebrae_extractor(self, caplog):
         logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
 
-        input_path = "data/input/segmentations/*.nii"
+        input_path = SEGMENTATIONS
         output_path = "tests/data/preprocess/vertebrae.csv"
         study_id = "1.2.826.0.1.3680043.12281"
         slice_number = 116
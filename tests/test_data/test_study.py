@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_study.py                                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:22:19 pm                                                #
+# Modified   : Friday October 16th 2026 11:00:59 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+
+# Enter imports for modules and classes being tested here
+from csf.data.study import StudyLoader
+from conftest import STUDY_ID, N_SLICES, IMAGE_SIZE
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.mark.study
+class TestStudyLoader:
+    def test_load(self, study_directory, monkeypatch, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        loader = StudyLoader(directory=study_directory, n_workers=4)
+        study = loader.load(STUDY_ID)
+
+        assert study.shape == (N_SLICES, IMAGE_SIZE, IMAGE_SIZE)
+        assert study.pixels.dtype == np.int16
+        assert study.pixels.flags["C_CONTIGUOUS"]
+        assert np.array_equal(study.instance_numbers, np.arange(1, N_SLICES + 1))
+        assert np.array_equal(study.pixels[:, 0, 0], 1024 + np.arange(1, N_SLICES + 1))
+        assert np.all(study.intercepts == -1024)
+        assert study.spacing == (1.25, 0.5, 0.5)
+
+        reads = []
+        read = loader._io.read
+
+        def spy(filepath, **kwargs):
+            reads.append(filepath)
+            return read(filepath, **kwargs)
+
+        monkeypatch.setattr(loader, "_io", type("SpyIO", (), {"read": staticmethod(spy)}))
+        loader.load(STUDY_ID)
+        assert sorted(reads) == sorted(study.filepaths)
+
+        study = StudyLoader(directory=study_directory, sort_by="ImagePositionPatient").load(
+            STUDY_ID
+        )
+        assert np.array_equal(study.instance_numbers, np.arange(N_SLICES, 0, -1))
+
+        with pytest.raises(FileNotFoundError):
+            loader.load("missing")
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
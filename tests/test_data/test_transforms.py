@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Cervical Spine Fracture Detection                                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /test_transforms.py                                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/Cervical-Spine-Fracture-Detection                  #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:29:12 pm                                                #
+# Modified   : Friday October 16th 2026 11:11:19 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import pytest
+import logging
+import logging.config
+import numpy as np
+import tensorflow as tf
+
+# Enter imports for modules and classes being tested here
+from csf.data.transforms import (
+    volume_to_hounsfield,
+    multi_windower,
+    MultiWindower,
+    bounding_box,
+    crop,
+    crop_study,
+    Hounsfield,
+    Windower,
+    Crop,
+    Resize,
+    resample,
+    WINDOW_BONE,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+
+
+@pytest.fixture
+def pixels():
+    return np.random.default_rng(0).integers(0, 3000, size=(10, 32, 32)).astype(np.int16)
+
+
+@pytest.mark.transforms
+class TestHounsfield:
+    def test_volume_to_hounsfield(self, pixels, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        slopes = np.ones(10)
+        intercepts = np.full(10, -1024.0)
+        expected = pixels.astype(np.float64) - 1024
+
+        hu = volume_to_hounsfield(pixels, slopes, intercepts)
+        assert hu.dtype == np.int16
+        assert np.array_equal(hu, expected)
+
+        out = np.empty(pixels.shape, dtype=np.float32)
+        assert volume_to_hounsfield(pixels, slopes, intercepts, out=out) is out
+        assert np.allclose(out, expected)
+
+        slopes = np.linspace(0.5, 1.5, 10)
+        intercepts = np.linspace(-1024, -1000, 10)
+        expected = slopes[:, None, None] * pixels + intercepts[:, None, None]
+        hu = volume_to_hounsfield(pixels, slopes, intercepts, chunk_size=3)
+        assert np.abs(hu - expected).max() <= 0.51
+        hu = volume_to_hounsfield(pixels, slopes, intercepts, dtype=np.float32)
+        assert np.allclose(hu, expected, atol=1e-2)
+
+        volume_to_hounsfield(pixels, slopes, intercepts, out=pixels)
+        assert np.abs(pixels - expected).max() <= 0.51
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.transforms
+class TestMultiWindower:
+    def test_multi_windower(self, pixels, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        hu = pixels - 1024
+        original = hu.copy()
+        windows = ((1800, 400), (400, 40))
+
+        image = multi_windower(hu, windows=windows)
+        assert image.shape == hu.shape + (2,)
+        assert image.dtype == np.uint8
+        assert np.array_equal(hu, original)
+
+        expected = np.rint((np.clip(hu, -160, 240).astype(np.float64) + 160) * 255 / 400)
+        assert np.array_equal(image[..., 1], expected)
+
+        image = multi_windower(hu, windows=windows, dtype=np.float16)
+        assert image.dtype == np.float16
+        assert image.min() >= 0 and image.max() <= 1
+
+        layer = MultiWindower(windows=windows)
+        assert np.array_equal(layer(hu).numpy(), multi_windower(hu, windows=windows))
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.transforms
+class TestCrop:
+    def test_crop(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        volume = np.zeros((3, 20, 20), dtype=np.int16)
+        volume[0, 5:8, 4:9] = 100
+        volume[2, 10:15, 2:6] = -50
+
+        assert bounding_box(volume[0]) == (5, 8, 4, 9)
+        assert crop(volume[0]).shape == (3, 5)
+        assert bounding_box(volume[1]) == (0, 20, 0, 20)
+
+        cropped, box = crop_study(volume)
+        assert box == (5, 15, 2, 9)
+        assert cropped.shape == (3, 10, 7)
+        assert cropped.flags["C_CONTIGUOUS"]
+
+        cropped, box = crop_study(volume[:2], box=box)
+        assert cropped.shape == (2, 10, 7)
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.transforms
+class TestLayers:
+    def test_tf_data(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        pixels = np.zeros((4, 32, 32), dtype=np.int16)
+        pixels[:, 8:20, 4:28] = 1500
+        dataset = tf.data.Dataset.from_tensor_slices(
+            (pixels, np.ones(4, dtype=np.float32), np.full(4, -1024, dtype=np.float32))
+        )
+        hounsfield, windower = Hounsfield(), Windower(window=(400, 40))
+        crop, resize = Crop(background=-160), Resize(output_shape=(16, 16))
+
+        def preprocess(pixels, slope, intercept):
+            image = windower(hounsfield((pixels, slope, intercept)))
+            return resize(crop(image))
+
+        images = list(dataset.map(preprocess, num_parallel_calls=tf.data.AUTOTUNE))
+        assert len(images) == 4
+        assert images[0].shape == (16, 16)
+        assert np.allclose(images[0].numpy(), 240)
+
+        crop_fn = tf.function(crop)
+        assert crop_fn(tf.constant(windower(pixels[0] - 1024))).shape == (12, 24)
+        assert crop_fn(tf.fill([8, 8], -160.0)).shape == (8, 8)
+        assert Windower().get_config()["window"] == WINDOW_BONE
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+
+@pytest.mark.transforms
+class TestResample:
+    def test_resample(self, caplog):
+        logger.info("\tStarted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))
+
+        volume = np.broadcast_to(np.arange(10, dtype=np.int16)[:, None, None], (10, 20, 20))
+        resampled = resample(volume, spacing=(2.0, 0.5, 0.5), target_spacing=(1.0, 1.0, 1.0))
+        assert resampled.shape == (20, 10, 10)
+        assert resampled.dtype == np.float32
+        expected = np.clip((np.arange(20) + 0.5) / 2 - 0.5, 0, 9)
+        assert np.allclose(resampled[:, 5, 5], expected)
+        assert np.allclose(resampled.std(axis=(1, 2)), 0)
+
+        resampled = resample(volume, spacing=(2.0, 0.5, 0.5), output_shape=(5, 7, 3), n_workers=3)
+        assert resampled.shape == (5, 7, 3)
+        assert np.allclose(resampled[:, 0, 0], [0.5, 2.5, 4.5, 6.5, 8.5])
+
+        logger.info("\tCompleted {} {}".format(self.__class__.__name__, inspect.stack()[0][3]))